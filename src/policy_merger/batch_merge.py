@@ -1,37 +1,39 @@
 from __future__ import annotations
 
-import argparse
-import os
-from typing import Dict, List, Tuple
+from itertools import chain
+from typing import List, Set, Tuple
 
-from .csv_loader import read_policy_csv
+from .csv_loader import filter_existing_paths, read_policy_csvs
 from .models import PolicyRule
 from .merger import write_merged_csv
 
 
 def batch_merge(file_paths: List[str], output_path: str) -> Tuple[int, int]:
-    policy_sets = [read_policy_csv(p) for p in file_paths]
-    all_rules: List[PolicyRule] = [r for ps in policy_sets for r in ps.rules]
-
-    kept_by_signature: Dict[Tuple[str, ...], PolicyRule] = {}
-    for rule in all_rules:
+    # Consume rules as each file finishes loading instead of materializing all rules first
+    seen: Set[Tuple[str, ...]] = set()
+    kept_rules: List[PolicyRule] = []
+    total = 0
+    for rule in chain.from_iterable(ps.rules for ps in read_policy_csvs(file_paths)):
+        total += 1
         sig = rule.identity_signature()
-        if sig not in kept_by_signature:
-            kept_by_signature[sig] = rule
-        # else: drop duplicates by identity signature
+        if sig in seen:
+            continue  # drop duplicates by identity signature
+        seen.add(sig)
+        kept_rules.append(rule)
 
-    kept_rules = list(kept_by_signature.values())
     write_merged_csv(output_path, kept_rules)
-    return len(all_rules), len(kept_rules)
+    return total, len(kept_rules)
 
 
 def main() -> None:
+    import argparse  # deferred: only needed when run as a script
+
     parser = argparse.ArgumentParser(description="Batch merge (deduplicate identical rules)")
     parser.add_argument("files", nargs="+", help="CSV files to load")
     parser.add_argument("--out", required=True, help="Path to write merged CSV")
     args = parser.parse_args()
 
-    csv_files = [f for f in args.files if os.path.exists(f)]
+    csv_files = filter_existing_paths(args.files)
     if not csv_files:
         raise SystemExit("No valid CSV files provided")
 
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-import argparse
-import os
+from collections import Counter
 from typing import List
 
-from .csv_loader import read_policy_csv
-from .diff_engine import find_similar_rules, group_by_identity
+from .csv_loader import filter_existing_paths, read_policy_csv
+from .diff_engine import find_similar_rules
 
 
 def summarize(file_paths: List[str]) -> None:
@@ -17,8 +16,8 @@ def summarize(file_paths: List[str]) -> None:
 
     # Combine all rules for initial suggestions
     all_rules = [r for ps in policy_sets for r in ps.rules]
-    identical_groups = group_by_identity(all_rules)
-    num_identical = sum(1 for rules in identical_groups.values() if len(rules) > 1)
+    signature_counts = Counter(r.identity_signature() for r in all_rules)
+    num_identical = sum(1 for cnt in signature_counts.values() if cnt > 1)
     print(f"Identical rule-groups (by identity signature): {num_identical}")
 
     suggestions = find_similar_rules(all_rules)
@@ -31,11 +30,13 @@ def summarize(file_paths: List[str]) -> None:
 
 
 def main() -> None:
+    import argparse  # deferred: only needed when run as a script
+
     parser = argparse.ArgumentParser(description="Policy Merger CLI")
     parser.add_argument("files", nargs="+", help="CSV files to load")
     args = parser.parse_args()
 
-    csv_files = [f for f in args.files if os.path.exists(f)]
+    csv_files = filter_existing_paths(args.files)
     if not csv_files:
         raise SystemExit("No valid CSV files provided")
 
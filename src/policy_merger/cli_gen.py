@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 import os
 import re
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Set
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Protocol, Sequence, Tuple, Set, TextIO, Union
 
 from policy_merger.models import PolicyRule
 
@@ -13,21 +14,21 @@ from policy_merger.models import PolicyRule
 # -----------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Address:
     name: str
     subnet: Tuple[str, str]  # (ip, mask)
     comment: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AddressGroup:
     name: str
     members: List[str]
     comment: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Service:
     name: str
     tcp_portrange: Optional[str] = None  # e.g., "80-80 443-443"
@@ -35,14 +36,14 @@ class Service:
     comment: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceGroup:
     name: str
     members: List[str]
     comment: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Vip:
     name: str
     extip: str
@@ -54,7 +55,7 @@ class Vip:
     comment: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IpPool:
     name: str
     startip: str
@@ -63,7 +64,7 @@ class IpPool:
     comment: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectCatalog:
     addresses: Dict[str, Address] = field(default_factory=dict)
     addr_groups: Dict[str, AddressGroup] = field(default_factory=dict)
@@ -71,6 +72,31 @@ class ObjectCatalog:
     service_groups: Dict[str, ServiceGroup] = field(default_factory=dict)
     vips: Dict[str, Vip] = field(default_factory=dict)
     ippools: Dict[str, IpPool] = field(default_factory=dict)
+    _sorted_cache: Dict[str, Tuple[int, List[str]]] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def sorted_names(self, section: str) -> List[str]:
+        """Sorted keys of a catalog section (e.g. "addresses"), cached across exports.
+
+        The cache is refreshed when the section's size changes; call
+        `invalidate_sorted()` after replacing or renaming entries in place.
+        """
+        table = getattr(self, section)
+        cached = self._sorted_cache.get(section)
+        if cached is None or cached[0] != len(table):
+            cached = (len(table), sorted(table))
+            self._sorted_cache[section] = cached
+        return cached[1]
+
+    def invalidate_sorted(self) -> None:
+        self._sorted_cache.clear()
+
+    def address_names(self) -> Set[str]:
+        """Names valid in srcaddr/dstaddr: addresses, address groups and VIPs."""
+        return set(self.addresses) | set(self.addr_groups) | set(self.vips)
+
+    def service_names(self) -> Set[str]:
+        """Names valid in service: custom services and service groups."""
+        return set(self.services) | set(self.service_groups)
 
 
 # -----------------------------
@@ -78,98 +104,158 @@ class ObjectCatalog:
 # -----------------------------
 
 
+@lru_cache(maxsize=16384)
 def _q(name: str) -> str:
-    """Quote a FortiOS object name safely for CLI."""
+    """Quote a FortiOS object name safely for CLI.
+
+    Cached: the same interface/address/service names recur across most policies.
+    """
     safe = name.replace('"', "'")
     return f'"{safe}"'
 
 
-def _split_values(value: Optional[str]) -> List[str]:
+# Dominance rules: (lower-cased dominant tokens, replacement value)
+Dominance = Tuple[FrozenSet[str], str]
+ADDRESS_DOMINANCE: Dominance = (frozenset({"all", "any"}), "all")
+SERVICE_DOMINANCE: Dominance = (frozenset({"all"}), "ALL")
+
+
+def _split_values(value: Optional[str], dominance: Optional[Dominance] = None) -> List[str]:
     """Split a multi-value cell conservatively.
 
     FortiManager CSV typically separates multiple names by spaces. Names with
     spaces are uncommon but possible; in that edge case users should rely on an
     object catalog to avoid naive tokenization. Here we split by whitespace and
     filter empties.
+
+    With `dominance`, the first dominant token short-circuits to the single
+    replacement value (e.g. any `all`/`any` address collapses to `["all"]`).
     """
     if not value:
         return []
-    s = value.strip()
-    if not s:
+    # str.split() without arguments collapses whitespace runs and drops empties
+    raw = value.split()
+    if not raw:
         return []
-    # Normalize whitespace to single spaces and split
-    s = " ".join(s.split())
-    raw = [t for t in s.split(" ") if t]
-    # Pair tokens like ["VLAN201:", "Office"] into "VLAN201: Office"
-    paired: List[str] = []
+    # Pair tokens like ["VLAN201:", "Office"] into "VLAN201: Office", de-duplicating in order
+    seen: Set[str] = set()
+    uniq: List[str] = []
     i = 0
-    while i < len(raw):
+    n = len(raw)
+    while i < n:
         tok = raw[i]
-        if tok.endswith(":") and i + 1 < len(raw):
-            paired.append(f"{tok} {raw[i+1]}")
-            i += 2
-            continue
         if tok.endswith(":"):
-            tok = tok[:-1]
-        paired.append(tok)
+            if i + 1 < n:
+                tok = f"{tok} {raw[i+1]}"
+                i += 1
+            else:
+                tok = tok[:-1]
         i += 1
-    # de-duplicate while preserving order
-    seen: set = set()
-    uniq: List[str] = []
-    for t in paired:
-        if t not in seen:
-            seen.add(t)
-            uniq.append(t)
+        if dominance is not None and tok.lower() in dominance[0]:
+            return [dominance[1]]
+        if tok not in seen:
+            seen.add(tok)
+            uniq.append(tok)
     return uniq
 
 
-def _emit_block(header: str, lines: Iterable[str]) -> List[str]:
-    emitted = [header]
-    emitted.extend(lines)
-    emitted.append("end")
-    return emitted
+class _LineSink(Protocol):
+    """Where generated CLI lines go: a list, or a `_LineWriter` streaming to a file."""
+
+    def append(self, line: str) -> None: ...
 
+    def extend(self, lines: Iterable[str]) -> None: ...
 
-def _emit_edit_block(name: str, setters: Iterable[str]) -> List[str]:
-    lines = [f"    edit {_q(name)}"]
+
+def _emit_edit_block(out: _LineSink, name: str, setters: Iterable[Optional[str]]) -> None:
+    out.append(f"    edit {_q(name)}")
     for s in setters:
         if s:
-            lines.append(f"        {s}")
-    lines.append("    next")
-    return lines
+            out.append(f"        {s}")
+    out.append("    next")
+
+
 # Catalog-aware greedy mapping of tokens into known names
-def _map_tokens_with_catalog(value: Optional[str], known_names: Set[str]) -> List[str]:
+TokenTrie = Dict[str, Any]
+
+# str.split() never yields empty tokens, so "" is free to mark the end of a name
+_TRIE_END = ""
+
+
+def build_token_trie(names: Iterable[str]) -> TokenTrie:
+    """Index catalog names by their space-separated tokens for longest-match lookup."""
+    root: TokenTrie = {}
+    for name in names:
+        tokens = name.split()
+        # Only names that can be re-joined from single-space tokens are reachable
+        if not tokens or " ".join(tokens) != name:
+            continue
+        node = root
+        for tok in tokens:
+            node = node.setdefault(tok, {})
+        node[_TRIE_END] = name
+    return root
+
+
+def _map_tokens_with_catalog(
+    value: Optional[str],
+    known_names: Union[Set[str], TokenTrie],
+    dominance: Optional[Dominance] = None,
+) -> List[str]:
+    """Greedily group tokens into the longest known catalog names.
+
+    `known_names` may be a plain set of names or a trie from `build_token_trie`;
+    callers mapping many values should build the trie once and pass it in.
+    `dominance` behaves as in `_split_values`.
+    """
     if not value:
         return []
     s = value.strip()
     if not s or not known_names:
-        return _split_values(value)
-    # Normalize whitespace and split to raw tokens without pairing
-    raw_tokens = [t for t in " ".join(s.split()).split(" ") if t]
+        return _split_values(value, dominance)
+    # Split to raw tokens without pairing
+    raw_tokens = s.split()
     i = 0
-    out: List[str] = []
     n = len(raw_tokens)
-    while i < n:
-        matched = None
-        # Try longest span first
-        for j in range(n, i, -1):
-            cand = " ".join(raw_tokens[i:j])
-            if cand in known_names:
-                matched = cand
-                i = j
-                break
-        if matched is None:
-            # Fallback to single token
-            matched = raw_tokens[i]
-            i += 1
-        out.append(matched)
-    # De-duplicate while preserving order
+    is_trie = isinstance(known_names, dict)
     seen: Set[str] = set()
     uniq: List[str] = []
-    for t in out:
-        if t not in seen:
-            seen.add(t)
-            uniq.append(t)
+    while i < n:
+        matched = None
+        if is_trie:
+            # Walk the trie from position i, remembering the last complete name seen
+            node = known_names
+            end = i + 1
+            j = i
+            while j < n:
+                node = node.get(raw_tokens[j])
+                if node is None:
+                    break
+                j += 1
+                if _TRIE_END in node:
+                    matched = node[_TRIE_END]
+                    end = j
+            if matched is None:
+                matched = raw_tokens[i]
+            i = end
+        else:
+            # Try longest span first
+            for j in range(n, i, -1):
+                cand = " ".join(raw_tokens[i:j])
+                if cand in known_names:
+                    matched = cand
+                    i = j
+                    break
+            if matched is None:
+                # Fallback to single token
+                matched = raw_tokens[i]
+                i += 1
+        if dominance is not None and matched.lower() in dominance[0]:
+            return [dominance[1]]
+        # De-duplicate while preserving order
+        if matched not in seen:
+            seen.add(matched)
+            uniq.append(matched)
     return uniq
 
 # -----------------------------
@@ -177,17 +263,26 @@ def _map_tokens_with_catalog(value: Optional[str], known_names: Set[str]) -> Lis
 # -----------------------------
 
 
+_TRUTHY = frozenset({"enable", "enabled", "1", "true", "yes"})
+_NAT_ENABLED = frozenset({"enable", "1", "true", "yes"})
+_LOGTRAFFIC_PASSTHRU = frozenset({"utm", "all", "disable"})
+_LOGTRAFFIC_ALL = frozenset({"enabled", "enable", "yes", "true"})
+_LOGTRAFFIC_DISABLE = frozenset({"no", "false"})
+
+
 def _truthy(value: Optional[str]) -> bool:
-    if value is None:
-        return False
-    return str(value).strip().lower() in {"enable", "enabled", "1", "true", "yes"}
+    return value is not None and str(value).strip().lower() in _TRUTHY
 
 
-def _has_any_profile(r: Dict[str, str]) -> bool:  # type: ignore[name-defined]
-    for k in ("av-profile", "webfilter-profile", "dnsfilter-profile", "ips-sensor", "application-list", "ssl-ssh-profile"):
-        if r.get(k):
-            return True
-    return False
+# Security profile columns, in the order they are emitted
+_PROFILE_FIELDS: Tuple[str, ...] = (
+    "av-profile",
+    "webfilter-profile",
+    "dnsfilter-profile",
+    "ips-sensor",
+    "application-list",
+    "ssl-ssh-profile",
+)
 
 
 def _map_logtraffic(val: Optional[str]) -> str:
@@ -195,11 +290,11 @@ def _map_logtraffic(val: Optional[str]) -> str:
         return "utm"
     s = str(val).strip().lower()
     # Map common CSV values to CLI
-    if s in {"utm", "all", "disable"}:
+    if s in _LOGTRAFFIC_PASSTHRU:
         return s
-    if s in {"enabled", "enable", "yes", "true"}:
+    if s in _LOGTRAFFIC_ALL:
         return "all"
-    if s in {"no", "false"}:
+    if s in _LOGTRAFFIC_DISABLE:
         return "disable"
     return s
 
@@ -211,14 +306,20 @@ def _map_logtraffic(val: Optional[str]) -> str:
 
 DEFAULT_INTERFACE_EXCLUDES: Set[str] = {"_default", "VLAN1"}
 
+# Fallback policy lines used when a field maps to no tokens
+_DEFAULT_SRCINTF_LINE = '        set srcintf "any"'
+_DEFAULT_DSTINTF_LINE = '        set dstintf "any"'
+_DEFAULT_SRCADDR_LINE = '        set srcaddr "all"'
+_DEFAULT_DSTADDR_LINE = '        set dstaddr "all"'
+_DEFAULT_SERVICE_LINE = '        set service "ALL"'
+
 
 def _map_interface_tokens(value: Optional[str], excludes: Optional[Set[str]] = None) -> List[str]:
     if not value:
         return []
-    s = " ".join(value.strip().split())
-    if not s:
+    raw_tokens = value.split()
+    if not raw_tokens:
         return []
-    raw_tokens = [t for t in s.split(" ") if t]
     mapped: List[str] = []
     for tok in raw_tokens:
         t = tok.strip()
@@ -254,72 +355,112 @@ def _map_interface_tokens(value: Optional[str], excludes: Optional[Set[str]] = N
 # -----------------------------
 # Generators per section
 # -----------------------------
+# Each generator appends to `out` when given, and otherwise returns its own lines.
 
 
-def generate_addresses(addresses: Dict[str, Address]) -> List[str]:
-    if not addresses:
-        return []
+def generate_addresses(
+    addresses: Dict[str, Address],
+    out: Optional[_LineSink] = None,
+    names: Optional[Sequence[str]] = None,
+) -> List[str]:
     lines: List[str] = []
-    for name in sorted(addresses.keys()):
+    if out is None:
+        out = lines
+    if not addresses:
+        return lines
+    out.append("config firewall address")
+    for name in (names if names is not None else sorted(addresses)):
         a = addresses[name]
         setters = [
             f"set subnet {a.subnet[0]} {a.subnet[1]}",
             f"set comment {_q(a.comment)}" if a.comment else None,
         ]
-        lines.extend(_emit_edit_block(a.name, setters))
-    return _emit_block("config firewall address", lines)
+        _emit_edit_block(out, a.name, setters)
+    out.append("end")
+    return lines
 
 
-def generate_address_groups(groups: Dict[str, AddressGroup]) -> List[str]:
-    if not groups:
-        return []
+def generate_address_groups(
+    groups: Dict[str, AddressGroup],
+    out: Optional[_LineSink] = None,
+    names: Optional[Sequence[str]] = None,
+) -> List[str]:
     lines: List[str] = []
-    for name in sorted(groups.keys()):
+    if out is None:
+        out = lines
+    if not groups:
+        return lines
+    out.append("config firewall addrgrp")
+    for name in (names if names is not None else sorted(groups)):
         g = groups[name]
         members = " ".join(_q(m) for m in sorted(set(g.members))) if g.members else None
         setters = [
             f"set member {members}" if members else None,
             f"set comment {_q(g.comment)}" if g.comment else None,
         ]
-        lines.extend(_emit_edit_block(g.name, setters))
-    return _emit_block("config firewall addrgrp", lines)
+        _emit_edit_block(out, g.name, setters)
+    out.append("end")
+    return lines
 
 
-def generate_services(services: Dict[str, Service]) -> List[str]:
-    if not services:
-        return []
+def generate_services(
+    services: Dict[str, Service],
+    out: Optional[_LineSink] = None,
+    names: Optional[Sequence[str]] = None,
+) -> List[str]:
     lines: List[str] = []
-    for name in sorted(services.keys()):
+    if out is None:
+        out = lines
+    if not services:
+        return lines
+    out.append("config firewall service custom")
+    for name in (names if names is not None else sorted(services)):
         s = services[name]
         setters = [
             f"set tcp-portrange {s.tcp_portrange}" if s.tcp_portrange else None,
             f"set udp-portrange {s.udp_portrange}" if s.udp_portrange else None,
             f"set comment {_q(s.comment)}" if s.comment else None,
         ]
-        lines.extend(_emit_edit_block(s.name, setters))
-    return _emit_block("config firewall service custom", lines)
+        _emit_edit_block(out, s.name, setters)
+    out.append("end")
+    return lines
 
 
-def generate_service_groups(groups: Dict[str, ServiceGroup]) -> List[str]:
-    if not groups:
-        return []
+def generate_service_groups(
+    groups: Dict[str, ServiceGroup],
+    out: Optional[_LineSink] = None,
+    names: Optional[Sequence[str]] = None,
+) -> List[str]:
     lines: List[str] = []
-    for name in sorted(groups.keys()):
+    if out is None:
+        out = lines
+    if not groups:
+        return lines
+    out.append("config firewall service group")
+    for name in (names if names is not None else sorted(groups)):
         g = groups[name]
         members = " ".join(_q(m) for m in sorted(set(g.members))) if g.members else None
         setters = [
             f"set member {members}" if members else None,
             f"set comment {_q(g.comment)}" if g.comment else None,
         ]
-        lines.extend(_emit_edit_block(g.name, setters))
-    return _emit_block("config firewall service group", lines)
+        _emit_edit_block(out, g.name, setters)
+    out.append("end")
+    return lines
 
 
-def generate_vips(vips: Dict[str, Vip]) -> List[str]:
-    if not vips:
-        return []
+def generate_vips(
+    vips: Dict[str, Vip],
+    out: Optional[_LineSink] = None,
+    names: Optional[Sequence[str]] = None,
+) -> List[str]:
     lines: List[str] = []
-    for name in sorted(vips.keys()):
+    if out is None:
+        out = lines
+    if not vips:
+        return lines
+    out.append("config firewall vip")
+    for name in (names if names is not None else sorted(vips)):
         v = vips[name]
         setters = [
             f"set extip {v.extip}",
@@ -330,15 +471,23 @@ def generate_vips(vips: Dict[str, Vip]) -> List[str]:
             f"set mappedport {v.mappedport}" if v.mappedport else None,
             f"set comment {_q(v.comment)}" if v.comment else None,
         ]
-        lines.extend(_emit_edit_block(v.name, setters))
-    return _emit_block("config firewall vip", lines)
+        _emit_edit_block(out, v.name, setters)
+    out.append("end")
+    return lines
 
 
-def generate_ippools(pools: Dict[str, IpPool]) -> List[str]:
-    if not pools:
-        return []
+def generate_ippools(
+    pools: Dict[str, IpPool],
+    out: Optional[_LineSink] = None,
+    names: Optional[Sequence[str]] = None,
+) -> List[str]:
     lines: List[str] = []
-    for name in sorted(pools.keys()):
+    if out is None:
+        out = lines
+    if not pools:
+        return lines
+    out.append("config firewall ippool")
+    for name in (names if names is not None else sorted(pools)):
         p = pools[name]
         setters = [
             f"set startip {p.startip}",
@@ -346,8 +495,9 @@ def generate_ippools(pools: Dict[str, IpPool]) -> List[str]:
             f"set type {p.pool_type}" if p.pool_type else None,
             f"set comment {_q(p.comment)}" if p.comment else None,
         ]
-        lines.extend(_emit_edit_block(p.name, setters))
-    return _emit_block("config firewall ippool", lines)
+        _emit_edit_block(out, p.name, setters)
+    out.append("end")
+    return lines
 
 
 def generate_policies(
@@ -355,36 +505,31 @@ def generate_policies(
     name_overrides: Optional[List[str]] = None,
     catalog: Optional[ObjectCatalog] = None,
     interface_excludes: Optional[Set[str]] = None,
+    out: Optional[_LineSink] = None,
 ) -> List[str]:
-    if not rules:
-        return []
     lines: List[str] = []
+    if out is None:
+        out = lines
+    if not rules:
+        return lines
+    out.append("config firewall policy")
+    # Address/service mapping: prefer catalog names if provided
+    if catalog is not None:
+        addr_trie = build_token_trie(catalog.address_names())
+        svc_trie = build_token_trie(catalog.service_names())
     for idx, rule in enumerate(rules):
         r = rule.raw
         srcintf = _map_interface_tokens(r.get("srcintf"), interface_excludes)
         dstintf = _map_interface_tokens(r.get("dstintf"), interface_excludes)
-        # Address/service mapping: prefer catalog names if provided
+        # Dominance rules: 'all'/'any' in addresses or 'ALL' in services collapse the field
         if catalog is not None:
-            addr_names: Set[str] = (
-                set(catalog.addresses.keys())
-                | set(catalog.addr_groups.keys())
-                | set(catalog.vips.keys())
-            )
-            svc_names: Set[str] = set(catalog.services.keys()) | set(catalog.service_groups.keys())
-            srcaddr = _map_tokens_with_catalog(r.get("srcaddr"), addr_names)
-            dstaddr = _map_tokens_with_catalog(r.get("dstaddr"), addr_names)
-            services = _map_tokens_with_catalog(r.get("service"), svc_names)
+            srcaddr = _map_tokens_with_catalog(r.get("srcaddr"), addr_trie, ADDRESS_DOMINANCE)
+            dstaddr = _map_tokens_with_catalog(r.get("dstaddr"), addr_trie, ADDRESS_DOMINANCE)
+            services = _map_tokens_with_catalog(r.get("service"), svc_trie, SERVICE_DOMINANCE)
         else:
-            srcaddr = _split_values(r.get("srcaddr"))
-            dstaddr = _split_values(r.get("dstaddr"))
-            services = _split_values(r.get("service"))
-        # Dominance rules: if 'all'/'any' present in addresses or 'ALL' in services
-        if any(t.lower() == 'all' or t.lower() == 'any' for t in srcaddr):
-            srcaddr = ['all']
-        if any(t.lower() == 'all' or t.lower() == 'any' for t in dstaddr):
-            dstaddr = ['all']
-        if any(t.upper() == 'ALL' for t in services):
-            services = ['ALL']
+            srcaddr = _split_values(r.get("srcaddr"), ADDRESS_DOMINANCE)
+            dstaddr = _split_values(r.get("dstaddr"), ADDRESS_DOMINANCE)
+            services = _split_values(r.get("service"), SERVICE_DOMINANCE)
         # name override (if provided)
         name_value = None
         if name_overrides is not None and 0 <= idx < len(name_overrides):
@@ -392,41 +537,31 @@ def generate_policies(
         if not name_value:
             name_value = r.get('name', r.get('policyid', 'policy'))
 
-        srcintf_line = (
-            f"set srcintf {' '.join(_q(i) for i in srcintf)}" if srcintf else "set srcintf \"any\""
-        )
-        dstintf_line = (
-            f"set dstintf {' '.join(_q(i) for i in dstintf)}" if dstintf else "set dstintf \"any\""
-        )
-        setters = [
-            # allocate next-id; name for determinism
-            f"set name {_q(name_value)}",
-            srcintf_line,
-            dstintf_line,
-            f"set srcaddr {' '.join(_q(a) for a in srcaddr)}" if srcaddr else "set srcaddr \"all\"",
-            f"set dstaddr {' '.join(_q(a) for a in dstaddr)}" if dstaddr else "set dstaddr \"all\"",
-            f"set service {' '.join(_q(s) for s in services)}" if services else "set service \"ALL\"",
-            f"set schedule {_q(r.get('schedule', 'always'))}",
-            f"set action {r.get('action', 'accept')}",
-            "set nat enable" if str(r.get("nat", "disable")).lower() in {"enable", "1", "true", "yes"} else None,
-            # Profiles and logging (only when present)
-            "set utm-status enable" if _truthy(r.get("utm-status")) or _has_any_profile(r) else None,
-            f"set av-profile {_q(r['av-profile'])}" if r.get('av-profile') else None,
-            f"set webfilter-profile {_q(r['webfilter-profile'])}" if r.get('webfilter-profile') else None,
-            f"set dnsfilter-profile {_q(r['dnsfilter-profile'])}" if r.get('dnsfilter-profile') else None,
-            f"set ips-sensor {_q(r['ips-sensor'])}" if r.get('ips-sensor') else None,
-            f"set application-list {_q(r['application-list'])}" if r.get('application-list') else None,
-            f"set ssl-ssh-profile {_q(r['ssl-ssh-profile'])}" if r.get('ssl-ssh-profile') else None,
-            f"set logtraffic {_map_logtraffic(r.get('logtraffic'))}" if r.get('logtraffic') else None,
-        ]
-        policy_lines = ["    edit 0"]
-        for s in setters:
-            if s:
-                policy_lines.append(f"        {s}")
-        policy_lines.append("    next")
-        lines.extend(policy_lines)
-
-    return _emit_block("config firewall policy", lines)
+        out.append("    edit 0")
+        # allocate next-id; name for determinism
+        out.append(f"        set name {_q(name_value)}")
+        out.append(f"        set srcintf {' '.join(_q(i) for i in srcintf)}" if srcintf else _DEFAULT_SRCINTF_LINE)
+        out.append(f"        set dstintf {' '.join(_q(i) for i in dstintf)}" if dstintf else _DEFAULT_DSTINTF_LINE)
+        out.append(f"        set srcaddr {' '.join(_q(a) for a in srcaddr)}" if srcaddr else _DEFAULT_SRCADDR_LINE)
+        out.append(f"        set dstaddr {' '.join(_q(a) for a in dstaddr)}" if dstaddr else _DEFAULT_DSTADDR_LINE)
+        out.append(f"        set service {' '.join(_q(s) for s in services)}" if services else _DEFAULT_SERVICE_LINE)
+        out.append(f"        set schedule {_q(r.get('schedule', 'always'))}")
+        out.append(f"        set action {r.get('action', 'accept')}")
+        if str(r.get("nat", "disable")).lower() in _NAT_ENABLED:
+            out.append("        set nat enable")
+        # Profiles and logging (only when present); one scan of the profile columns
+        # decides utm-status and yields the setters
+        profiles = [(key, r[key]) for key in _PROFILE_FIELDS if r.get(key)]
+        if profiles or _truthy(r.get("utm-status")):
+            out.append("        set utm-status enable")
+        for key, value in profiles:
+            out.append(f"        set {key} {_q(value)}")
+        if r.get('logtraffic'):
+            out.append(f"        set logtraffic {_map_logtraffic(r.get('logtraffic'))}")
+        out.append("    next")
+
+    out.append("end")
+    return lines
 
 
 # -----------------------------
@@ -443,6 +578,7 @@ def build_unique_policy_names(rules: Sequence[PolicyRule], max_len: int = 35) ->
     used: set[str] = set()
     overrides: List[str] = []
     renames: List[Tuple[str, str]] = []
+    next_suffix: Dict[str, int] = {}
 
     def _truncate_for_suffix(base: str, suffix: str) -> str:
         if len(base) + len(suffix) <= max_len:
@@ -458,32 +594,56 @@ def build_unique_policy_names(rules: Sequence[PolicyRule], max_len: int = 35) ->
             used.add(candidate)
             overrides.append(candidate)
             continue
-        # Need to add numeric suffix -1, -2, ... ensuring uniqueness and length
-        i = 1
+        # Need to add numeric suffix -1, -2, ... ensuring uniqueness and length.
+        # Suffixes below next_suffix[base] are already taken, so resume there.
+        i = next_suffix.get(base_name, 1)
         while True:
             suffix = f"-{i}"
             cand = _truncate_for_suffix(base_name, suffix) + suffix
+            i += 1
             if cand not in used:
+                next_suffix[base_name] = i
                 used.add(cand)
                 overrides.append(cand)
                 if cand != base_name:
                     renames.append((base_name, cand))
                 break
-            i += 1
     return overrides, renames
 
 
-def generate_fgt_cli(
-    rules: Sequence[PolicyRule],
-    catalog: Optional[ObjectCatalog] = None,
-    include_objects: bool = False,
-    name_overrides: Optional[List[str]] = None,
-    interface_excludes: Optional[Set[str]] = None,
-) -> str:
-    sections: List[str] = []
+class _LineWriter:
+    """List-like sink that streams appended lines to a text stream.
+
+    Lines are newline-separated exactly like `"\n".join(lines)`, so streamed
+    output is identical to `generate_fgt_cli`.
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        self._stream = stream
+        self._first = True
+
+    def append(self, line: str) -> None:
+        if self._first:
+            self._first = False
+        else:
+            self._stream.write("\n")
+        self._stream.write(line)
 
+    def extend(self, lines: Iterable[str]) -> None:
+        for line in lines:
+            self.append(line)
+
+
+def _emit_fgt_cli(
+    out: _LineSink,
+    rules: Sequence[PolicyRule],
+    catalog: Optional[ObjectCatalog],
+    include_objects: bool,
+    name_overrides: Optional[List[str]],
+    interface_excludes: Optional[Set[str]],
+) -> List[Tuple[str, str]]:
     # Header banner (comments)
-    sections.append("# Generated by Policy Merger\n# Version: 1.0.0\n")
+    out.extend(["# Generated by Policy Merger", "# Version: 1.0.0", ""])
 
     # Ensure unique policy names
     overrides: Optional[List[str]] = None
@@ -493,24 +653,25 @@ def generate_fgt_cli(
     else:
         overrides, renames = build_unique_policy_names(rules, max_len=35)
     if renames:
-        sections.append("# Renamed policies for uniqueness (max 35):")
+        out.append("# Renamed policies for uniqueness (max 35):")
         for old, new in renames[:200]:  # cap to keep script concise
-            sections.append(f"# {old} -> {new}")
-        sections.append("")
+            out.append(f"# {old} -> {new}")
+        out.append("")
 
     if include_objects and catalog is not None:
-        # Emit in required order
-        for emitter, data in [
-            (generate_addresses, catalog.addresses),
-            (generate_address_groups, catalog.addr_groups),
-            (generate_services, catalog.services),
-            (generate_service_groups, catalog.service_groups),
-            (generate_vips, catalog.vips),
-            (generate_ippools, catalog.ippools),
+        # Emit in required order; each block is followed by a blank line
+        for emitter, section in [
+            (generate_addresses, "addresses"),
+            (generate_address_groups, "addr_groups"),
+            (generate_services, "services"),
+            (generate_service_groups, "service_groups"),
+            (generate_vips, "vips"),
+            (generate_ippools, "ippools"),
         ]:
-            block = emitter(data)
-            if block:
-                sections.append("\n".join(block) + "\n")
+            data = getattr(catalog, section)
+            if data:
+                emitter(data, out, names=catalog.sorted_names(section))
+                out.append("")
 
     # resolve interface excludes from env if not supplied
     if interface_excludes is None:
@@ -524,15 +685,43 @@ def generate_fgt_cli(
         else:
             interface_excludes = set(DEFAULT_INTERFACE_EXCLUDES)
 
-    policy_block = generate_policies(
-        rules,
-        name_overrides=overrides,
-        catalog=catalog,
-        interface_excludes=interface_excludes,
-    )
-    if policy_block:
-        sections.append("\n".join(policy_block) + "\n")
+    if rules:
+        generate_policies(
+            rules,
+            name_overrides=overrides,
+            catalog=catalog,
+            interface_excludes=interface_excludes,
+            out=out,
+        )
+        out.append("")
 
-    return "\n".join(sections)
+    return renames
 
 
+def generate_fgt_cli(
+    rules: Sequence[PolicyRule],
+    catalog: Optional[ObjectCatalog] = None,
+    include_objects: bool = False,
+    name_overrides: Optional[List[str]] = None,
+    interface_excludes: Optional[Set[str]] = None,
+) -> str:
+    out: List[str] = []
+    _emit_fgt_cli(out, rules, catalog, include_objects, name_overrides, interface_excludes)
+    return "\n".join(out)
+
+
+def stream_fgt_cli(
+    rules: Sequence[PolicyRule],
+    stream: TextIO,
+    catalog: Optional[ObjectCatalog] = None,
+    include_objects: bool = False,
+    name_overrides: Optional[List[str]] = None,
+    interface_excludes: Optional[Set[str]] = None,
+) -> List[Tuple[str, str]]:
+    """Write the same script as `generate_fgt_cli` directly to `stream`.
+
+    Avoids holding the whole script in memory for large exports. Returns the
+    (original, new) policy renames applied for uniqueness.
+    """
+    writer = _LineWriter(stream)
+    return _emit_fgt_cli(writer, rules, catalog, include_objects, name_overrides, interface_excludes)
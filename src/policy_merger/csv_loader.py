@@ -1,23 +1,74 @@
 from __future__ import annotations
 
+import codecs
+import csv
+import io
 import os
-import re
-from typing import List, Tuple
-
-import pandas as pd
+from typing import TYPE_CHECKING, BinaryIO, Dict, Iterator, List, Sequence, Set, Tuple
 
 from .models import PolicySet
 
+if TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
+
 
 HEADER_KEY = "policyid"
-SOURCE_TAG_REGEX = re.compile(r"^(?P<device>.+?)-\d{8}-\d{6}$")
+# Byte-order marks that override the requested encoding (UTF-32 first: its LE BOM
+# starts with the UTF-16 LE one)
+_UTF_BOMS: Tuple[Tuple[bytes, str], ...] = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
 
 
 def derive_source_fortigate_tag(path: str) -> str:
     base = os.path.basename(path)
     name, _ext = os.path.splitext(base)
-    m = SOURCE_TAG_REGEX.match(name)
-    return m.group("device") if m else name
+    # Export names look like "<device>-YYYYMMDD-HHMMSS"; the device part may itself contain dashes
+    parts = name.rsplit("-", 2)
+    if (
+        len(parts) == 3
+        and parts[0]
+        and len(parts[1]) == 8
+        and len(parts[2]) == 6
+        and parts[1].isdecimal()
+        and parts[2].isdecimal()
+    ):
+        return parts[0]
+    return name
+
+
+def filter_existing_paths(paths: Sequence[str]) -> List[str]:
+    """Return the paths that exist, preserving order.
+
+    Paths sharing a directory are checked with one `os.scandir` listing
+    instead of a stat per file.
+    """
+    by_dir: Dict[str, List[str]] = {}
+    for p in paths:
+        by_dir.setdefault(os.path.dirname(p), []).append(p)
+    existing: Set[str] = set()
+    for d, members in by_dir.items():
+        if len(members) == 1:
+            if os.path.exists(members[0]):
+                existing.add(members[0])
+            continue
+        try:
+            with os.scandir(d or ".") as it:
+                entries = {e.name: e for e in it}
+        except OSError:
+            continue
+        for p in members:
+            e = entries.get(os.path.basename(p))
+            if e is None:
+                # Trailing separators, "..", etc. - defer to the OS
+                if os.path.exists(p):
+                    existing.add(p)
+            elif not e.is_symlink() or os.path.exists(p):
+                existing.add(p)
+    return [p for p in paths if p in existing]
 
 
 def find_header_row(path: str, encoding: str = "utf-8") -> int:
@@ -28,38 +79,120 @@ def find_header_row(path: str, encoding: str = "utf-8") -> int:
     raise ValueError(f"Could not locate header containing '{HEADER_KEY}' in: {path}")
 
 
+def _seek_header(fh: BinaryIO, path: str) -> None:
+    """Position a binary handle at the start of the header line."""
+    key = HEADER_KEY.encode("ascii")
+    while True:
+        pos = fh.tell()
+        line = fh.readline()
+        if not line:
+            raise ValueError(f"Could not locate header containing '{HEADER_KEY}' in: {path}")
+        if key in line:
+            fh.seek(pos)
+            return
+
+
+def _open_at_header(fb: BinaryIO, path: str, encoding: str) -> io.TextIOWrapper:
+    """Wrap a binary handle as text, positioned at the start of the header line."""
+    head = fb.read(4)
+    fb.seek(0)
+    for bom, name in _UTF_BOMS:
+        if head.startswith(bom):
+            encoding = name
+            break
+    if codecs.lookup(encoding).name == "utf-8":
+        encoding = "utf-8-sig"  # drop a BOM when the header is the first line
+    if HEADER_KEY.encode("ascii").decode(encoding, errors="replace") == HEADER_KEY:
+        # ASCII-compatible encoding: find the header on the raw bytes
+        _seek_header(fb, path)
+        return io.TextIOWrapper(fb, encoding=encoding, newline="")
+    # UTF-16/32: scan decoded lines instead
+    fh = io.TextIOWrapper(fb, encoding=encoding, newline="")
+    while True:
+        pos = fh.tell()
+        line = fh.readline()
+        if not line:
+            raise ValueError(f"Could not locate header containing '{HEADER_KEY}' in: {path}")
+        if HEADER_KEY in line:
+            fh.seek(pos)
+            return fh
+
+
+def _dedupe_columns(names: Sequence[str]) -> List[str]:
+    """Suffix repeated column names with .1, .2, ... (as pandas does)."""
+    counts: Dict[str, int] = {}
+    out: List[str] = []
+    for col in names:
+        cur = counts.get(col, 0)
+        while cur > 0:
+            counts[col] = cur + 1
+            col = f"{col}.{cur}"
+            cur = counts.get(col, 0)
+        out.append(col)
+        counts[col] = cur + 1
+    return out
+
+
 def read_policy_csv(path: str, encoding: str = "utf-8") -> PolicySet:
-    header_row = find_header_row(path, encoding=encoding)
-    df = pd.read_csv(
-        path,
-        header=0,  # header row is the first row after skipped preamble
-        skiprows=header_row,
-        dtype=str,
-        keep_default_na=False,
-        na_values=[],
-        encoding=encoding,
-        engine="python",
-        sep=",",
-        quotechar='"',
-    )
-    df.columns = [c.strip() for c in df.columns]
-
-    source_tag = derive_source_fortigate_tag(path)
-    policy_set = PolicySet(source_fortigate=source_tag, columns=list(df.columns))
-
-    for _, row in df.iterrows():
-        raw = {col: (str(row[col]) if row[col] is not None else "") for col in df.columns}
-        policy_set.add_rule(raw)
+    # Single open: skip the preamble on the handle and stream rows with the csv module
+    with open(path, "rb") as fb:
+        with _open_at_header(fb, path, encoding) as fh:
+            reader = csv.reader(fh, delimiter=",", quotechar='"')
+            header = [c or f"Unnamed: {i}" for i, c in enumerate(next(reader))]
+            columns = [c.strip() for c in _dedupe_columns(header)]
+            source_tag = derive_source_fortigate_tag(path)
+            policy_set = PolicySet(source_fortigate=source_tag, columns=columns)
+            width = len(columns)
+            # Values repeat heavily across rules (actions, schedules, interfaces, objects);
+            # share one string object per distinct value within the file. Not sys.intern:
+            # the process-wide table would keep every UUID and comment alive in the GUI
+            pool: Dict[str, str] = {}
+            for row in reader:
+                if len(row) < 2 and not (row and row[0].strip()):
+                    continue  # blank line
+                if len(row) > width:
+                    raise ValueError(
+                        f"Expected {width} fields in line {reader.line_num} of {path}, saw {len(row)}"
+                    )
+                if len(row) < width:
+                    row.extend([""] * (width - len(row)))
+                policy_set.add_rule(dict(zip(columns, [pool.setdefault(v, v) for v in row])))
 
     return policy_set
 
 
+def read_policy_csvs(
+    paths: Sequence[str],
+    max_workers: int | None = None,
+    mp_context: BaseContext | None = None,
+) -> Iterator[PolicySet]:
+    """Read several policy CSVs, parsing files in parallel worker processes.
+
+    Results are yielded in input order as soon as each file is parsed, so callers
+    can start consuming rules before every file has been loaded. Pass a "spawn"
+    `mp_context` when calling from a multi-threaded process (e.g. the GUI), where
+    forking could deadlock on locks held by other threads.
+    """
+    if len(paths) <= 1:
+        for p in paths:
+            yield read_policy_csv(p)
+        return
+    workers = max_workers or min(len(paths), os.cpu_count() or 1)
+    from concurrent.futures import ProcessPoolExecutor  # deferred: pulls in multiprocessing
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as ex:
+        yield from ex.map(read_policy_csv, paths, chunksize=1)
+
+
 def write_policy_csv(path: str, policy_set: PolicySet, encoding: str = "utf-8") -> None:
     # Preserve column order if available; otherwise infer from first row
     columns: List[str] = policy_set.columns
     if not columns and policy_set.rules:
         columns = list(policy_set.rules[0].raw.keys())
-    df = pd.DataFrame(policy_set.to_rows(), columns=columns)
-    df.to_csv(path, index=False, encoding=encoding)
+    # Stream rows straight to disk; missing cells are written empty, unknown keys ignored
+    with open(path, "w", newline="", encoding=encoding) as fh:
+        writer = csv.DictWriter(fh, fieldnames=columns, restval="", extrasaction="ignore", lineterminator=os.linesep)
+        writer.writeheader()
+        writer.writerows(policy_set.to_rows())
 
 
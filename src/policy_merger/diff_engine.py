@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import hashlib
+from bisect import bisect_right
 from collections import defaultdict
-from dataclasses import dataclass
-from typing import Dict, Iterable, List, Sequence, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import AbstractSet, Dict, Iterable, Iterator, List, Sequence, Set, Tuple
 
 from .models import PolicyRule
 FIVE_FIELDS: Tuple[str, str, str, str, str] = (
@@ -23,33 +26,38 @@ STABLE_CONTEXT_FIELDS: Tuple[str, ...] = (
 
 
 
+# Field values repeat heavily across rules; memoize normalization/tokenization.
+# Call `_normalize_space.cache_clear()` etc. to release memory in long-lived processes.
+@lru_cache(maxsize=1 << 16)
 def _normalize_space(value: str) -> str:
     return " ".join((value or "").strip().split())
 
 
-def _tokenize_multi_value(value: str) -> List[str]:
-    # Phase 1: naive space-splitting; later phases will replace with dictionary-aware parsing
-    normalized = _normalize_space(value)
-    if not normalized:
-        return []
-    return normalized.split(" ")
+@lru_cache(maxsize=1 << 16)
+def _tokenize_multi_value(value: str) -> Tuple[str, ...]:
+    # Phase 1: naive whitespace-splitting; later phases will replace with dictionary-aware parsing
+    return tuple((value or "").split())
 
 
-def jaccard_similarity(a_tokens: Sequence[str], b_tokens: Sequence[str]) -> float:
-    a_set, b_set = set(a_tokens), set(b_tokens)
+def jaccard_similarity(a_tokens: Sequence[str] | AbstractSet[str], b_tokens: Sequence[str] | AbstractSet[str]) -> float:
+    # Sets are used as-is; the union size follows from the intersection, so no union set is built
+    a_set = a_tokens if isinstance(a_tokens, AbstractSet) else set(a_tokens)
+    b_set = b_tokens if isinstance(b_tokens, AbstractSet) else set(b_tokens)
     if not a_set and not b_set:
         return 1.0
     intersection = len(a_set & b_set)
-    union = len(a_set | b_set)
+    union = len(a_set) + len(b_set) - intersection
     return intersection / union if union else 0.0
 
 
 def compare_rules(rule_a: PolicyRule, rule_b: PolicyRule, fields: Sequence[str]) -> Dict[str, Tuple[str, str]]:
     diffs: Dict[str, Tuple[str, str]] = {}
+    get_a, get_b = rule_a.raw.get, rule_b.raw.get
     for field in fields:
-        a_val = rule_a.raw.get(field, "")
-        b_val = rule_b.raw.get(field, "")
-        if _normalize_space(a_val) != _normalize_space(b_val):
+        a_val = get_a(field, "")
+        b_val = get_b(field, "")
+        # Equal raw values need no normalization
+        if a_val != b_val and _normalize_space(a_val) != _normalize_space(b_val):
             diffs[field] = (a_val, b_val)
     return diffs
 
@@ -61,16 +69,62 @@ def group_by_identity(rules: Iterable[PolicyRule]) -> Dict[Tuple[str, ...], List
     return groups
 
 
+def _stable_digest(prefix: str, values: Iterable[str]) -> bytes:
+    """Digest of a rule's normalized values for the column order encoded in `prefix`."""
+    payload = prefix + "\x1f".join(map(_normalize_space, values))
+    return hashlib.blake2b(payload.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class _StableKeyGrouper:
+    """Incremental `group_by_stable_key`, so other per-rule passes can share its loop.
+
+    Rules are bucketed by a digest of their normalized values; the readable
+    (field, value) key is built once per group from its first rule.
+    """
+
+    def __init__(self, excluded_fields: Sequence[str]) -> None:
+        self._excluded = set(excluded_fields)
+        self._by_digest: Dict[bytes, List[PolicyRule]] = {}
+        self._display: Dict[bytes, Tuple[Tuple[str, str], ...]] = {}
+        self._last_keys = None
+        self._order: Tuple[str, ...] = ()
+        self._prefix = ""
+
+    def add(self, rule: PolicyRule) -> None:
+        raw = rule.raw
+        if raw.keys() != self._last_keys:
+            # Rules loaded from one CSV share a column set; sort it only when it changes
+            self._last_keys = raw.keys()
+            self._order = tuple(k for k in sorted(raw) if k not in self._excluded)
+            self._prefix = "\x1e".join(self._order) + "\x1d"
+        order = self._order
+        digest = _stable_digest(self._prefix, map(raw.__getitem__, order))
+        bucket = self._by_digest.get(digest)
+        if bucket is None:
+            bucket = self._by_digest[digest] = []
+            self._display[digest] = tuple((k, _normalize_space(raw[k])) for k in order)
+        bucket.append(rule)
+
+    def groups(self) -> Dict[Tuple[Tuple[str, str], ...], List[PolicyRule]]:
+        groups: Dict[Tuple[Tuple[str, str], ...], List[PolicyRule]] = defaultdict(list)
+        for digest, bucket in self._by_digest.items():
+            groups[self._display[digest]].extend(bucket)
+        return groups
+
+
 def group_by_stable_key(
     rules: Iterable[PolicyRule], excluded_fields: Sequence[str]
 ) -> Dict[Tuple[Tuple[str, str], ...], List[PolicyRule]]:
-    groups: Dict[Tuple[Tuple[str, str], ...], List[PolicyRule]] = defaultdict(list)
-    excluded = set(excluded_fields)
+    # Stable key uses all fields except those in excluded_fields
+    grouper = _StableKeyGrouper(excluded_fields)
     for rule in rules:
-        # Stable key uses all fields except those in excluded_fields
-        items = tuple(sorted((k, _normalize_space(v)) for k, v in rule.raw.items() if k not in excluded))
-        groups[items].append(rule)
-    return groups
+        grouper.add(rule)
+    return grouper.groups()
+
+
+def _context_key(rule: PolicyRule, context_fields: Sequence[str]) -> Tuple[Tuple[str, str], ...]:
+    get = rule.raw.get
+    return tuple((field, _normalize_space(get(field, ""))) for field in context_fields)
 
 
 def group_by_minimal_context(rules: Iterable[PolicyRule]) -> Dict[Tuple[Tuple[str, str], ...], List[PolicyRule]]:
@@ -81,13 +135,38 @@ def group_by_minimal_context(rules: Iterable[PolicyRule]) -> Dict[Tuple[Tuple[st
     """
     groups: Dict[Tuple[Tuple[str, str], ...], List[PolicyRule]] = defaultdict(list)
     for rule in rules:
-        items = []
-        for field in STABLE_CONTEXT_FIELDS:
-            items.append((field, _normalize_space(rule.raw.get(field, ""))))
-        groups[tuple(items)].append(rule)
+        groups[_context_key(rule, STABLE_CONTEXT_FIELDS)].append(rule)
     return groups
 
 
+def compute_all_groupings(
+    rules: Iterable[PolicyRule],
+    excluded_for_stable: Sequence[str],
+    context_fields: Sequence[str] = STABLE_CONTEXT_FIELDS,
+    include_context: bool = True,
+) -> Tuple[
+    Dict[Tuple[str, ...], List[PolicyRule]],
+    Dict[Tuple[Tuple[str, str], ...], List[PolicyRule]],
+    Dict[Tuple[Tuple[str, str], ...], List[PolicyRule]],
+]:
+    """Identity, stable-key and minimal-context groupings in a single pass over `rules`.
+
+    Equivalent to calling `group_by_identity`, `group_by_stable_key` and
+    `group_by_minimal_context` separately, for callers that need more than one.
+    With `include_context=False` the minimal-context grouping is skipped and
+    returned empty.
+    """
+    identity: Dict[Tuple[str, ...], List[PolicyRule]] = defaultdict(list)
+    stable = _StableKeyGrouper(excluded_for_stable)
+    context: Dict[Tuple[Tuple[str, str], ...], List[PolicyRule]] = defaultdict(list)
+    for rule in rules:
+        identity[rule.identity_signature()].append(rule)
+        stable.add(rule)
+        if include_context:
+            context[_context_key(rule, context_fields)].append(rule)
+    return identity, stable.groups(), context
+
+
 @dataclass
 class SimilaritySuggestion:
     stable_key: Tuple[Tuple[str, str], ...]
@@ -95,6 +174,11 @@ class SimilaritySuggestion:
     similarity_score: float
     rule_a: PolicyRule
     rule_b: PolicyRule
+    # Sorted differing field names, for labels and chips
+    diff_fields: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.diff_fields = tuple(sorted(self.field_diffs))
 @dataclass
 class MergeGroupSuggestion:
     varying_field: str
@@ -104,50 +188,222 @@ class MergeGroupSuggestion:
 
 
 
+def _token_mask(value: str, token_ids: Dict[str, int]) -> int:
+    mask = 0
+    for tok in _tokenize_multi_value(value):
+        tid = token_ids.get(tok)
+        if tid is None:
+            tid = token_ids[tok] = len(token_ids)
+        mask |= 1 << tid
+    return mask
+
+
+def _mask_jaccard(a_mask: int, b_mask: int) -> float:
+    """`jaccard_similarity` on token sets encoded as bitmasks."""
+    union = (a_mask | b_mask).bit_count()
+    return (a_mask & b_mask).bit_count() / union if union else 1.0
+
+
+# Block counts for which all pair scores are computed as NumPy matrices: below the
+# minimum the setup cost dominates, above the maximum the B x B matrices get too large.
+_MATRIX_MIN_BLOCKS = 32
+_MATRIX_MAX_BLOCKS = 2048
+
+
+def _block_score_matrix(blocks: Sequence[Tuple[str, ...]]) -> Tuple[List[List[float]], List[List[int]]]:
+    """Scores and differing-field bitmasks for every block pair, as nested lists.
+
+    Per field, a block x token incidence matrix gives all intersections in one matmul.
+    Scores are the average Jaccard over differing fields, identical to the scalar path
+    (1.0 where no field differs); bit k of a mask is set when field k differs.
+    """
+    import numpy as np  # deferred: only needed for large groups
+
+    n_blocks = len(blocks)
+    total = np.zeros((n_blocks, n_blocks))
+    counts = np.zeros((n_blocks, n_blocks))
+    masks = np.zeros((n_blocks, n_blocks), dtype=np.int64)
+    for k in range(len(blocks[0])):
+        value_ids: Dict[str, int] = {}
+        token_ids: Dict[str, int] = {}
+        rows: List[int] = []
+        cols: List[int] = []
+        vids = np.empty(n_blocks, dtype=np.int64)
+        for b, values in enumerate(blocks):
+            v = values[k]
+            vids[b] = value_ids.setdefault(v, len(value_ids))
+            for tok in set(_tokenize_multi_value(v)):
+                rows.append(b)
+                cols.append(token_ids.setdefault(tok, len(token_ids)))
+        incidence = np.zeros((n_blocks, max(len(token_ids), 1)))
+        incidence[rows, cols] = 1.0
+        inter = incidence @ incidence.T
+        sizes = incidence.sum(axis=1)
+        union = sizes[:, None] + sizes[None, :] - inter
+        jacc = np.divide(inter, union, out=np.ones_like(inter), where=union > 0)
+        differs = vids[:, None] != vids[None, :]
+        total += np.where(differs, jacc, 0.0)
+        counts += differs
+        masks |= differs.astype(np.int64) << k
+    avg = np.divide(total, counts, out=np.ones_like(total), where=counts > 0)
+    return avg.tolist(), masks.tolist()
+
+
+def _candidate_rules(blocks: Sequence[Tuple[str, ...]], rule_blocks: Sequence[int]) -> List[List[int]]:
+    """For each block, the sorted rule indices that can score above zero against it.
+
+    A pair scores zero unless some field where the two differ shares a token, so only
+    rules in the same block or in a block sharing a token with it in a differing field
+    are candidates. Built from an inverted index over the block values.
+    """
+    index: Dict[Tuple[int, str], List[int]] = defaultdict(list)
+    for b, values in enumerate(blocks):
+        for k, v in enumerate(values):
+            for tok in set(_tokenize_multi_value(v)):
+                index[(k, tok)].append(b)
+    members: List[List[int]] = [[] for _ in blocks]
+    for idx, b in enumerate(rule_blocks):
+        members[b].append(idx)
+    result: List[List[int]] = []
+    for b, values in enumerate(blocks):
+        related = {b}
+        for k, v in enumerate(values):
+            for tok in set(_tokenize_multi_value(v)):
+                related.update(c for c in index[(k, tok)] if blocks[c][k] != v)
+        result.append(sorted(idx for rb in related for idx in members[rb]))
+    return result
+
+
+def similarity_excluded_fields(candidate_fields: Sequence[str]) -> Tuple[str, ...]:
+    # Exclude variable/non-stable fields from grouping such as name/policyid in addition to candidate fields
+    return tuple(candidate_fields) + ("name", "policyid")
+
+
+PairScore = Tuple[int, int, Tuple[str, ...], float]
+
+
+def _pair_scores(
+    values: Sequence[Tuple[str, ...]],
+    fields: Sequence[str],
+    min_similarity: float | None = None,
+) -> Iterator[PairScore]:
+    """Yield (i, j, differing_fields, score) for the pairs of a group, in (i, j) order.
+
+    `values` holds each rule's normalized `fields`. Identical pairs always score 1.0;
+    other pairs are kept when their average Jaccard over the differing fields reaches
+    `min_similarity` (always when None).
+    """
+    n = len(values)
+    if n < 2:
+        return
+    # Block rules by their normalized values: pairs within a block are identical, and
+    # the differing fields/score between two blocks only depend on those values, so they
+    # are computed once per block pair rather than per rule pair.
+    block_index: Dict[Tuple[str, ...], int] = {}
+    blocks: List[Tuple[str, ...]] = []
+    rule_blocks: List[int] = []
+    # Each block's per-field token set as an int bitmask over group-local token ids,
+    # so Jaccard is two popcounts
+    token_ids: Dict[str, int] = {}
+    block_masks: List[Tuple[int, ...]] = []
+    for vals in values:
+        idx = block_index.get(vals)
+        if idx is None:
+            idx = block_index[vals] = len(blocks)
+            blocks.append(vals)
+            block_masks.append(tuple(_token_mask(v, token_ids) for v in vals))
+        rule_blocks.append(idx)
+    block_pairs: Dict[Tuple[int, int], Tuple[Tuple[str, ...], float]] = {}
+    candidates = _candidate_rules(blocks, rule_blocks) if min_similarity is not None and min_similarity > 0 else None
+    if candidates is None and _MATRIX_MIN_BLOCKS <= len(blocks) <= _MATRIX_MAX_BLOCKS and len(fields) <= 8:
+        # Every block pair is needed when nothing is pruned: score them all in one NumPy
+        # pass, leaving only list lookups in the per-pair loop
+        score_matrix, diff_matrix = _block_score_matrix(blocks)
+        subsets = [tuple(f for k, f in enumerate(fields) if m >> k & 1) for m in range(1 << len(fields))]
+        for i in range(n):
+            block_a = rule_blocks[i]
+            score_row, diff_row = score_matrix[block_a], diff_matrix[block_a]
+            for j in range(i + 1, n):
+                block_b = rule_blocks[j]
+                avg_score = score_row[block_b]
+                if min_similarity is not None and avg_score < min_similarity:
+                    continue
+                yield i, j, subsets[diff_row[block_b]], avg_score
+        return
+    for i in range(n):
+        block_a = rule_blocks[i]
+        if candidates is None:
+            partners: Iterable[int] = range(i + 1, n)
+        else:
+            js = candidates[block_a]
+            partners = js[bisect_right(js, i):]
+        for j in partners:
+            block_b = rule_blocks[j]
+            if block_a == block_b:
+                # identical within candidate fields; treat as identical overall
+                yield i, j, (), 1.0
+                continue
+            cached = block_pairs.get((block_a, block_b))
+            if cached is None:
+                # Average Jaccard across multi-value fields that differ
+                a_vals, b_vals = blocks[block_a], blocks[block_b]
+                differing = tuple(f for f, x, y in zip(fields, a_vals, b_vals) if x != y)
+                a_masks, b_masks = block_masks[block_a], block_masks[block_b]
+                scores = [
+                    _mask_jaccard(a_masks[k], b_masks[k])
+                    for k, (x, y) in enumerate(zip(a_vals, b_vals))
+                    if x != y
+                ]
+                avg_score = sum(scores) / len(scores)
+                cached = block_pairs[(block_a, block_b)] = (differing, avg_score)
+            differing, avg_score = cached
+            if min_similarity is not None and avg_score < min_similarity:
+                continue
+            yield i, j, differing, avg_score
+
+
+def _group_values(group_rules: Sequence[PolicyRule], fields: Sequence[str]) -> List[Tuple[str, ...]]:
+    return [tuple(_normalize_space(r.raw.get(f, "")) for f in fields) for r in group_rules]
+
+
+def _append_pair_suggestions(
+    suggestions: List[SimilaritySuggestion],
+    stable_key: Tuple[Tuple[str, str], ...],
+    group_rules: Sequence[PolicyRule],
+    scores: Iterable[PairScore],
+) -> None:
+    for i, j, differing, score in scores:
+        a, b = group_rules[i], group_rules[j]
+        suggestions.append(
+            SimilaritySuggestion(
+                stable_key=stable_key,
+                field_diffs={f: (a.raw.get(f, ""), b.raw.get(f, "")) for f in differing},
+                similarity_score=score,
+                rule_a=a,
+                rule_b=b,
+            )
+        )
+
+
 def find_similar_rules(
     rules: Iterable[PolicyRule],
     candidate_fields: Sequence[str] = ("srcaddr", "dstaddr", "service"),
     min_similarity: float = 0.2,
+    stable_groups: Dict[Tuple[Tuple[str, str], ...], List[PolicyRule]] | None = None,
 ) -> List[SimilaritySuggestion]:
+    """Suggest every pair of rules that agree outside `candidate_fields`.
+
+    `stable_groups` may pass in a grouping already computed with
+    `similarity_excluded_fields(candidate_fields)` (e.g. from `compute_all_groupings`).
+    """
     suggestions: List[SimilaritySuggestion] = []
-    # Exclude variable/non-stable fields from grouping such as name/policyid in addition to candidate fields
-    excluded_fields: Tuple[str, ...] = tuple(candidate_fields) + ("name", "policyid")
-    groups = group_by_stable_key(rules, excluded_fields=excluded_fields)
-    for stable_key, group_rules in groups.items():
-        n = len(group_rules)
-        if n < 2:
-            continue
-        for i in range(n):
-            for j in range(i + 1, n):
-                a, b = group_rules[i], group_rules[j]
-                diffs = compare_rules(a, b, candidate_fields)
-                if not diffs:
-                    # identical within candidate fields; treat as identical overall
-                    suggestions.append(
-                        SimilaritySuggestion(
-                            stable_key=stable_key,
-                            field_diffs={},
-                            similarity_score=1.0,
-                            rule_a=a,
-                            rule_b=b,
-                        )
-                    )
-                    continue
-                # Compute average Jaccard across multi-value fields that differ
-                # Always suggest when any of the five fields differ; similarity is informational only
-                scores: List[float] = []
-                for field, (a_val, b_val) in diffs.items():
-                    scores.append(jaccard_similarity(_tokenize_multi_value(a_val), _tokenize_multi_value(b_val)))
-                avg_score = sum(scores) / len(scores) if scores else 0.0
-                suggestions.append(
-                    SimilaritySuggestion(
-                        stable_key=stable_key,
-                        field_diffs=diffs,
-                        similarity_score=avg_score,
-                        rule_a=a,
-                        rule_b=b,
-                    )
-                )
+    if stable_groups is None:
+        stable_groups = group_by_stable_key(rules, excluded_fields=similarity_excluded_fields(candidate_fields))
+    groups = [(stable_key, group_rules) for stable_key, group_rules in stable_groups.items() if len(group_rules) >= 2]
+    fields = tuple(candidate_fields)
+    # Always suggest when any of the candidate fields differ; similarity is informational only
+    for stable_key, group_rules in groups:
+        _append_pair_suggestions(suggestions, stable_key, group_rules, _pair_scores(_group_values(group_rules, fields), fields))
     return suggestions
 
 
@@ -156,7 +412,7 @@ def deduplicate_identical_rules(rules: Iterable[PolicyRule]) -> Tuple[List[Polic
 
     Returns a tuple of (unique_rules, num_removed).
     """
-    seen: Dict[Tuple[str, ...], PolicyRule] = {}
+    seen: Set[Tuple[str, ...]] = set()
     unique: List[PolicyRule] = []
     removed = 0
     for r in rules:
@@ -164,7 +420,7 @@ def deduplicate_identical_rules(rules: Iterable[PolicyRule]) -> Tuple[List[Polic
         if sig in seen:
             removed += 1
             continue
-        seen[sig] = r
+        seen.add(sig)
         unique.append(r)
     return unique, removed
 
@@ -185,13 +441,16 @@ def group_similarity_suggestions(
 
 
 def five_field_key(rule: PolicyRule) -> Tuple[str, str, str, str, str]:
-    return tuple(_normalize_space(rule.raw.get(field, "")) for field in FIVE_FIELDS)  # type: ignore[return-value]
+    # Same normalization as _normalize_space, inlined: this runs once per rule on import
+    get = rule.raw.get
+    return tuple([" ".join((get(field) or "").split()) for field in FIVE_FIELDS])  # type: ignore[return-value]
 
 
 def group_duplicates_by_five_fields(rules: Iterable[PolicyRule]) -> Dict[Tuple[str, str, str, str, str], List[PolicyRule]]:
     groups: Dict[Tuple[str, str, str, str, str], List[PolicyRule]] = defaultdict(list)
+    key = five_field_key
     for r in rules:
-        groups[five_field_key(r)].append(r)
+        groups[key(r)].append(r)
     return groups
 
 
@@ -213,38 +472,10 @@ def find_merge_suggestions_five_fields(
     # Group by a minimal stable context to catch cases differing only in name/service
     groups = group_by_minimal_context(rules)
     for stable_key, group_rules in groups.items():
-        n = len(group_rules)
-        if n < 2:
+        if len(group_rules) < 2:
             continue
-        for i in range(n):
-            for j in range(i + 1, n):
-                a, b = group_rules[i], group_rules[j]
-                diffs = compare_rules(a, b, FIVE_FIELDS)
-                if not diffs:
-                    suggestions.append(
-                        SimilaritySuggestion(
-                            stable_key=stable_key,
-                            field_diffs={},
-                            similarity_score=1.0,
-                            rule_a=a,
-                            rule_b=b,
-                        )
-                    )
-                    continue
-                scores: List[float] = []
-                for field, (a_val, b_val) in diffs.items():
-                    scores.append(jaccard_similarity(_tokenize_multi_value(a_val), _tokenize_multi_value(b_val)))
-                avg_score = sum(scores) / len(scores) if scores else 0.0
-                if avg_score >= min_similarity:
-                    suggestions.append(
-                        SimilaritySuggestion(
-                            stable_key=stable_key,
-                            field_diffs=diffs,
-                            similarity_score=avg_score,
-                            rule_a=a,
-                            rule_b=b,
-                        )
-                    )
+        scores = _pair_scores(_group_values(group_rules, FIVE_FIELDS), FIVE_FIELDS, min_similarity)
+        _append_pair_suggestions(suggestions, stable_key, group_rules, scores)
     return suggestions
 
 
@@ -284,31 +515,39 @@ def find_group_merge_suggestions_single_field(
     The resulting group is a candidate to union the varying field across all rules into one.
     """
     results: List[MergeGroupSuggestion] = []
-    for varying in FIVE_FIELDS:
-        groups: Dict[Tuple[str, ...] | Tuple, List[PolicyRule]] = defaultdict(list)
-        for r in rules:
-            other_values = [
-                _normalize_space(r.raw.get(f, ""))
-                for f in FIVE_FIELDS
-                if f != varying
-            ]
-            ctx = tuple((f, _normalize_space(r.raw.get(f, ""))) for f in context_fields)
-            key = tuple(other_values) + tuple(v for kv in ctx for v in kv)
-            groups[key].append(r)
-        for key, rs in groups.items():
-            if len(rs) < 2:
+    # Normalize and tokenize each rule once; every varying-field pass slices the
+    # precomputed five-field tuple instead of re-reading the rule
+    rule_list: List[PolicyRule] = []
+    fives: List[Tuple[str, ...]] = []
+    contexts: List[Tuple[str, ...]] = []
+    for r in rules:
+        rule_list.append(r)
+        fives.append(tuple(_normalize_space(r.raw.get(f, "")) for f in FIVE_FIELDS))
+        contexts.append(tuple(_normalize_space(r.raw.get(f, "")) for f in context_fields))
+    token_sets = [tuple(frozenset(_tokenize_multi_value(v)) for v in five) for five in fives]
+    for vi, varying in enumerate(FIVE_FIELDS):
+        groups: Dict[Tuple[str, ...], List[int]] = defaultdict(list)
+        for idx, (five, ctx_values) in enumerate(zip(fives, contexts)):
+            groups[five[:vi] + five[vi + 1 :] + ctx_values].append(idx)
+        for key, members in groups.items():
+            if len(members) < 2:
                 continue
             # Ensure there is meaningful variation in the varying field
-            token_sets = [set(_tokenize_multi_value(x.raw.get(varying, ""))) for x in rs]
-            union = set().union(*token_sets)
-            if len(union) <= min(len(ts) for ts in token_sets):
+            field_tokens = [token_sets[i][vi] for i in members]
+            union = frozenset().union(*field_tokens)
+            if len(union) <= min(len(ts) for ts in field_tokens):
                 # nothing new to union across the group
                 continue
             # Build context again for the group from first rule
-            r0 = rs[0]
-            ctx = tuple((f, _normalize_space(r0.raw.get(f, ""))) for f in context_fields)
-            base_key = tuple(_normalize_space(r0.raw.get(f, "")) for f in FIVE_FIELDS if f != varying)
-            results.append(MergeGroupSuggestion(varying_field=varying, base_key=base_key, context=ctx, rules=rs))
+            first = members[0]
+            ctx = tuple(zip(context_fields, contexts[first]))
+            base_key = fives[first][:vi] + fives[first][vi + 1 :]
+            results.append(
+                MergeGroupSuggestion(
+                    varying_field=varying,
+                    base_key=base_key,
+                    context=ctx,
+                    rules=[rule_list[i] for i in members],
+                )
+            )
     return results
-
-
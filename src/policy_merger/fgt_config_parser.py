@@ -14,48 +14,99 @@ from policy_merger.cli_gen import (
 )
 
 
-def _extract_blocks(lines: List[str], header: str) -> List[List[str]]:
-    blocks: List[List[str]] = []
-    in_section = False
-    section_lines: List[str] = []
+# Top-level sections read into the catalog
+_SECTION_HEADERS = (
+    "config firewall address",
+    "config firewall addrgrp",
+    "config firewall service custom",
+    "config firewall service group",
+    "config firewall vip",
+    "config firewall vipgrp",
+    "config firewall ippool",
+)
+
+
+def _extract_blocks(lines: List[str]) -> Dict[str, List[List[str]]]:
+    """Collect the stripped body lines of every known section in one pass, keyed by header.
+
+    A section runs from its header line to the next "end"; sections may overlap, and
+    every open section closes at that "end". Lines are stripped exactly once here so
+    `_parse_table` can use them as-is.
+    """
+    blocks: Dict[str, List[List[str]]] = {header: [] for header in _SECTION_HEADERS}
+    active: Dict[str, List[str]] = {}
+    # Body line sink for the usual case of exactly one open section
+    single: Optional[List[str]] = None
     for ln in lines:
         s = ln.strip()
-        if s == header:
-            in_section = True
-            section_lines = []
+        if s in blocks:
+            for header, section_lines in active.items():
+                if header != s:
+                    section_lines.append(s)
+            active[s] = []
+            single = active[s] if len(active) == 1 else None
+            continue
+        if not active:
             continue
-        if in_section and s == "end":
-            in_section = False
-            blocks.append(section_lines[:])
-            section_lines = []
+        if s == "end":
+            for header, section_lines in active.items():
+                blocks[header].append(section_lines)
+            active = {}
+            single = None
             continue
-        if in_section:
-            section_lines.append(ln)
+        if single is not None:
+            single.append(s)
+        else:
+            for section_lines in active.values():
+                section_lines.append(s)
     return blocks
 
 
 _re_edit = re.compile(r"\bedit\s+\"(?P<name>[^\"]+)\"")
 _re_set = re.compile(r"\bset\s+(?P<key>\S+)\s+(?P<val>.+)$")
+_re_member = re.compile(r'\"([^\"]+)\"')
+
+
+def _edit_name(s: str) -> Optional[str]:
+    # Fast path for the usual 'edit "<name>"' line; anything else goes through _re_edit
+    if s[:4] == "edit" and s[4:5].isspace():
+        rest = s[5:].lstrip()
+        if rest[:1] == '"':
+            end = rest.find('"', 1)
+            if end > 1:
+                return rest[1:end]
+    m_edit = _re_edit.search(s)
+    return m_edit.group("name") if m_edit else None
 
 
 def _parse_table(block: List[str]) -> Dict[str, Dict[str, str]]:
-    """Parse a FortiOS table section into name→{key:value} dict."""
+    """Parse a FortiOS table section (already-stripped lines) into name→{key:value} dict."""
     result: Dict[str, Dict[str, str]] = {}
     current: Optional[str] = None
-    for raw in block:
-        s = raw.strip()
-        m_edit = _re_edit.search(s)
-        if m_edit:
-            current = m_edit.group("name")
-            result[current] = {}
-            continue
-        m_set = _re_set.search(s)
-        if current and m_set:
-            key = m_set.group("key").strip()
-            val = m_set.group("val").strip()
-            result[current][key] = val
+    for s in block:
+        # Cheap substring/prefix checks first; the regexes only run when they can match
+        if "edit" in s:
+            name = _edit_name(s)
+            if name is not None:
+                current = name
+                result[current] = {}
+                continue
         if s == "next":
             current = None
+            continue
+        if not current:
+            continue
+        if s[:3] == "set" and s[3:4].isspace():
+            # Common case, same split as _re_set: "set <key> <value...>"
+            parts = s[4:].split(None, 1)
+            if len(parts) == 2:
+                result[current][parts[0]] = parts[1].strip()
+        elif "set" in s:
+            m_set = _re_set.search(s)
+            if m_set:
+                key = m_set.group("key").strip()
+                val = m_set.group("val").strip()
+                result[current][key] = val
     return result
 
 
@@ -63,10 +114,19 @@ def parse_fgt_config_text(text: str, catalog: Optional[ObjectCatalog] = None) ->
     """Parse FortiGate config text to ObjectCatalog (best-effort)."""
     if catalog is None:
         catalog = ObjectCatalog()
-    lines = text.splitlines()
+    blocks_by_header = _extract_blocks(text.splitlines())
+    # Bind the target dicts and helpers once; the loops below run per object
+    addresses = catalog.addresses
+    addr_groups = catalog.addr_groups
+    services = catalog.services
+    service_groups = catalog.service_groups
+    vips = catalog.vips
+    ippools = catalog.ippools
+    sq = _strip_quotes
+    split_members = _split_members
 
     # Addresses
-    for block in _extract_blocks(lines, "config firewall address"):
+    for block in blocks_by_header["config firewall address"]:
         tbl = _parse_table(block)
         for name, kv in tbl.items():
             subnet_val = kv.get("subnet", "").split()
@@ -75,67 +135,69 @@ def parse_fgt_config_text(text: str, catalog: Optional[ObjectCatalog] = None) ->
             else:
                 # FQDN, wildcard-fqdn, geography, or other types still need name presence for validation
                 ip, mask = "0.0.0.0", "0.0.0.0"
-            catalog.addresses[name] = Address(name=name, subnet=(ip, mask), comment=_strip_quotes(kv.get("comment")))
+            addresses[name] = Address(name=name, subnet=(ip, mask), comment=sq(kv.get("comment")))
 
     # Address groups
-    for block in _extract_blocks(lines, "config firewall addrgrp"):
+    for block in blocks_by_header["config firewall addrgrp"]:
         tbl = _parse_table(block)
         for name, kv in tbl.items():
-            members = _split_members(kv.get("member"))
-            catalog.addr_groups[name] = AddressGroup(name=name, members=members, comment=_strip_quotes(kv.get("comment")))
+            members = split_members(kv.get("member"))
+            addr_groups[name] = AddressGroup(name=name, members=members, comment=sq(kv.get("comment")))
 
     # Services (custom)
-    for block in _extract_blocks(lines, "config firewall service custom"):
+    for block in blocks_by_header["config firewall service custom"]:
         tbl = _parse_table(block)
         for name, kv in tbl.items():
-            catalog.services[name] = Service(
+            services[name] = Service(
                 name=name,
-                tcp_portrange=_strip_quotes(kv.get("tcp-portrange")),
-                udp_portrange=_strip_quotes(kv.get("udp-portrange")),
-                comment=_strip_quotes(kv.get("comment")),
+                tcp_portrange=sq(kv.get("tcp-portrange")),
+                udp_portrange=sq(kv.get("udp-portrange")),
+                comment=sq(kv.get("comment")),
             )
 
     # Service groups
-    for block in _extract_blocks(lines, "config firewall service group"):
+    for block in blocks_by_header["config firewall service group"]:
         tbl = _parse_table(block)
         for name, kv in tbl.items():
-            members = _split_members(kv.get("member"))
-            catalog.service_groups[name] = ServiceGroup(name=name, members=members, comment=_strip_quotes(kv.get("comment")))
+            members = split_members(kv.get("member"))
+            service_groups[name] = ServiceGroup(name=name, members=members, comment=sq(kv.get("comment")))
 
     # VIPs
-    for block in _extract_blocks(lines, "config firewall vip"):
+    for block in blocks_by_header["config firewall vip"]:
         tbl = _parse_table(block)
         for name, kv in tbl.items():
-            portforward = kv.get("portforward", "").strip().lower() == "enable"
-            catalog.vips[name] = Vip(
+            get = kv.get
+            portforward = get("portforward", "").strip().lower() == "enable"
+            vips[name] = Vip(
                 name=name,
-                extip=_strip_quotes(kv.get("extip", "")),
-                mappedip=_strip_quotes(kv.get("mappedip", "")),
-                extintf=_strip_quotes(kv.get("extintf")),
+                extip=sq(get("extip", "")),
+                mappedip=sq(get("mappedip", "")),
+                extintf=sq(get("extintf")),
                 portforward=portforward,
-                extport=_strip_quotes(kv.get("extport")),
-                mappedport=_strip_quotes(kv.get("mappedport")),
-                comment=_strip_quotes(kv.get("comment")),
+                extport=sq(get("extport")),
+                mappedport=sq(get("mappedport")),
+                comment=sq(get("comment")),
             )
 
     # VIP Groups (treat as address groups for name presence)
-    for block in _extract_blocks(lines, "config firewall vipgrp"):
+    for block in blocks_by_header["config firewall vipgrp"]:
         tbl = _parse_table(block)
         for name, kv in tbl.items():
-            members = _split_members(kv.get("member"))
+            members = split_members(kv.get("member"))
             # store in addr_groups to include in known set for dstaddr validation
-            if name not in catalog.addr_groups:
-                catalog.addr_groups[name] = AddressGroup(name=name, members=members, comment=_strip_quotes(kv.get("comment")))
+            if name not in addr_groups:
+                addr_groups[name] = AddressGroup(name=name, members=members, comment=sq(kv.get("comment")))
 
     # IP pools
-    for block in _extract_blocks(lines, "config firewall ippool"):
+    for block in blocks_by_header["config firewall ippool"]:
         tbl = _parse_table(block)
         for name, kv in tbl.items():
-            startip = _strip_quotes(kv.get("startip", ""))
-            endip = _strip_quotes(kv.get("endip", ""))
-            pool_type = _strip_quotes(kv.get("type"))
-            catalog.ippools[name] = IpPool(name=name, startip=startip, endip=endip, pool_type=pool_type or None, comment=_strip_quotes(kv.get("comment")))
+            startip = sq(kv.get("startip", ""))
+            endip = sq(kv.get("endip", ""))
+            pool_type = sq(kv.get("type"))
+            ippools[name] = IpPool(name=name, startip=startip, endip=endip, pool_type=pool_type or None, comment=sq(kv.get("comment")))
 
+    catalog.invalidate_sorted()
     return catalog
 
 
@@ -143,7 +205,7 @@ def _strip_quotes(val: Optional[str]) -> Optional[str]:
     if val is None:
         return None
     s = val.strip()
-    if s.startswith('"') and s.endswith('"') and len(s) >= 2:
+    if len(s) >= 2 and s[0] == '"' == s[-1]:
         return s[1:-1]
     return s
 
@@ -153,7 +215,6 @@ def _split_members(val: Optional[str]) -> List[str]:
         return []
     s = val.strip()
     # members are typically quoted names separated by spaces
-    names = re.findall(r'\"([^\"]+)\"', s)
-    return names
+    return _re_member.findall(s)
 
 
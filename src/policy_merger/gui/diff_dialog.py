@@ -2,13 +2,59 @@ from __future__ import annotations
 
 from typing import List, Tuple
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QColor
-from PyQt6.QtWidgets import QDialog, QDialogButtonBox, QLabel, QTableWidget, QTableWidgetItem, QVBoxLayout
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt, QVariant
+from PyQt6.QtGui import QBrush, QColor
+from PyQt6.QtWidgets import QDialog, QDialogButtonBox, QLabel, QTableView, QVBoxLayout
 
 from policy_merger.models import PolicyRule
 
 
+class _DiffModel(QAbstractTableModel):
+    """Read-only Field/A/B rows; Qt only asks for the cells it paints."""
+
+    _HEADERS = ("Field", "A", "B")
+
+    def __init__(self, rows: List[Tuple[str, str, str]], parent=None) -> None:
+        super().__init__(parent)
+        self._rows = rows
+        self._diff_brush = QBrush(QColor(255, 235, 205))  # light peach for differences
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        if parent.isValid():
+            return 0
+        return 3
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> QVariant:  # type: ignore[override]
+        if not index.isValid():
+            return QVariant()
+        row = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return row[index.column()]
+        if role == Qt.ItemDataRole.BackgroundRole and index.column() > 0 and row[1] != row[2]:
+            return self._diff_brush
+        return QVariant()
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):  # type: ignore[override]
+        if role != Qt.ItemDataRole.DisplayRole:
+            return QVariant()
+        if orientation == Qt.Orientation.Horizontal:
+            if 0 <= section < len(self._HEADERS):
+                return self._HEADERS[section]
+        else:
+            return section + 1
+        return QVariant()
+
+    def flags(self, index: QModelIndex):  # type: ignore[override]
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled
+
+
 class DiffDialog(QDialog):
     def __init__(self, rule_a: PolicyRule, rule_b: PolicyRule, columns: List[str], parent=None) -> None:
         super().__init__(parent)
@@ -21,30 +67,21 @@ class DiffDialog(QDialog):
         layout.addWidget(QLabel(f"A from {rule_a.source_fortigate}: {rule_a.raw.get('name','')}", self))
         layout.addWidget(QLabel(f"B from {rule_b.source_fortigate}: {rule_b.raw.get('name','')}", self))
 
-        table = QTableWidget(self)
-        table.setColumnCount(3)
-        table.setHorizontalHeaderLabels(["Field", "A", "B"])
         rows: List[Tuple[str, str, str]] = []
+        clean_a = rule_a.clean
+        clean_b = rule_b.clean
         for field in self.columns:
-            a_val = (rule_a.raw.get(field, "") or "").strip()
-            b_val = (rule_b.raw.get(field, "") or "").strip()
+            a_val = clean_a(field)
+            b_val = clean_b(field)
+            # Fields empty on both sides can't differ; leave them out of the table
+            if not a_val and not b_val:
+                continue
             rows.append((field, a_val, b_val))
-        table.setRowCount(len(rows))
-
-        diff_color = QColor(255, 235, 205)  # light peach for differences
-        for r, (field, a_val, b_val) in enumerate(rows):
-            item_field = QTableWidgetItem(field)
-            item_a = QTableWidgetItem(a_val)
-            item_b = QTableWidgetItem(b_val)
-            if a_val != b_val:
-                item_a.setBackground(diff_color)
-                item_b.setBackground(diff_color)
-            item_field.setFlags(Qt.ItemFlag.ItemIsEnabled)
-            item_a.setFlags(Qt.ItemFlag.ItemIsEnabled)
-            item_b.setFlags(Qt.ItemFlag.ItemIsEnabled)
-            table.setItem(r, 0, item_field)
-            table.setItem(r, 1, item_a)
-            table.setItem(r, 2, item_b)
+        if len(rows) < len(self.columns):
+            layout.addWidget(QLabel(f"Showing {len(rows)} of {len(self.columns)} fields (fields empty in both rules are hidden)", self))
+
+        table = QTableView(self)
+        table.setModel(_DiffModel(rows, table))
         table.resizeColumnsToContents()
         table.setAlternatingRowColors(True)
         layout.addWidget(table)
@@ -53,5 +90,3 @@ class DiffDialog(QDialog):
         buttons.rejected.connect(self.reject)
         buttons.accepted.connect(self.accept)
         layout.addWidget(buttons)
-
-
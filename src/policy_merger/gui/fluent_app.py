@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import multiprocessing
 import os
 import sys
 from dataclasses import dataclass, field
-from typing import List, Dict, Tuple, Any, Set
+from itertools import chain
+from typing import List, Dict, Tuple, Any, Set, Sequence
 
 from qfluentwidgets import (
     FluentWindow,
@@ -21,6 +23,7 @@ from qfluentwidgets import (
     TeachingTipTailPosition,
     TogglePushButton,
     ColorDialog,
+    IndeterminateProgressBar,
 )
 from PyQt6.QtWidgets import (
     QApplication,
@@ -37,15 +40,16 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QTableWidget,
     QTableWidgetItem,
+    QHeaderView,
     QComboBox,
     QLineEdit,
     QInputDialog,
     QTextEdit,
 )
-from PyQt6.QtCore import Qt, QUrl, QTimer
-from PyQt6.QtGui import QIcon, QDesktopServices
+from PyQt6.QtCore import Qt, QUrl, QTimer, QObject, QThread, QSignalBlocker, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QIcon, QDesktopServices, QColor
 
-from policy_merger.csv_loader import read_policy_csv
+from policy_merger.csv_loader import read_policy_csvs
 from policy_merger.diff_engine import (
     find_similar_rules,
     group_similarity_suggestions,
@@ -56,14 +60,15 @@ from policy_merger.diff_engine import (
     build_suggestion_reason,
     five_field_key,
     find_group_merge_suggestions_single_field,
+    SimilaritySuggestion,
 )
-from policy_merger.merger import write_merged_csv, merge_fields
+from policy_merger.merger import write_merged_csv, merge_fields, DEFAULT_MERGE_FIELDS
 from policy_merger.models import PolicySet
-from policy_merger.gui.models import PolicyTableModel
+from policy_merger.gui.models import PolicyTableModel, RuleDetailsModel
 from policy_merger.gui.merge_dialog import MergeDialog
 from policy_merger.gui.diff_dialog import DiffDialog
 from policy_merger.logging_config import configure_logging
-from policy_merger.cli_gen import generate_fgt_cli, ObjectCatalog, _map_tokens_with_catalog
+from policy_merger.cli_gen import stream_fgt_cli, ObjectCatalog, _map_tokens_with_catalog
 
 
 @dataclass
@@ -91,10 +96,8 @@ class AppState:
         if not self.model_snapshots:
             return False
         rows, cols = self.model_snapshots.pop()
-        from policy_merger.models import PolicySet as _PS
-        ps = _PS(source_fortigate="RESTORE", columns=cols)
-        for row in rows:
-            ps.add_rule(row)
+        ps = PolicySet(source_fortigate="RESTORE", columns=cols)
+        ps.add_rules(rows)
         self.model.set_policy_sets([ps])
         # restore resolved keys
         if self._resolved_keys_snapshots:
@@ -102,6 +105,65 @@ class AppState:
         return True
 
 
+def _fill_list(widget: QListWidget, labels: List[str]) -> None:
+    """Replace a list widget's items in one batch with repaints suspended."""
+    widget.setUpdatesEnabled(False)
+    try:
+        widget.clear()
+        widget.addItems(labels)
+    finally:
+        widget.setUpdatesEnabled(True)
+
+
+def _fill_table(widget: QTableWidget, rows: List[Sequence[str]], flags: Qt.ItemFlag | None = None) -> None:
+    """Replace a table widget's cells in one batch with repaints suspended, then size columns once."""
+    widget.setUpdatesEnabled(False)
+    try:
+        widget.setRowCount(len(rows))
+        for row, values in enumerate(rows):
+            for col, val in enumerate(values):
+                item = QTableWidgetItem(val)
+                if flags is not None:
+                    item.setFlags(flags)
+                widget.setItem(row, col, item)
+        widget.resizeColumnsToContents()
+    finally:
+        widget.setUpdatesEnabled(True)
+
+
+class _CsvLoadWorker(QObject):
+    """Reads the selected CSV exports and groups duplicates on a worker thread.
+
+    Results come back via signals: `loaded(policy_sets, duplicate_groups)` or `failed(message)`.
+    """
+
+    progress = pyqtSignal(int, int)
+    loaded = pyqtSignal(list, dict)
+    failed = pyqtSignal(str)
+
+    def __init__(self, paths: List[str]) -> None:
+        super().__init__()
+        self._paths = list(paths)
+
+    @pyqtSlot()
+    def run(self) -> None:
+        total = len(self._paths)
+        try:
+            # Several files are parsed in worker processes; results keep the selection order.
+            # Spawn, not fork: this process runs Qt and this worker thread.
+            policy_sets = []
+            spawn = multiprocessing.get_context("spawn")
+            for i, ps in enumerate(read_policy_csvs(self._paths, mp_context=spawn), start=1):
+                policy_sets.append(ps)
+                self.progress.emit(i, total)
+            # Duplicate groups for the dedupe review (no changes applied yet)
+            dup_groups = group_duplicates_by_five_fields(chain.from_iterable(ps.rules for ps in policy_sets))
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.loaded.emit(policy_sets, dup_groups)
+
+
 class ImportPage(QFrame):
     def __init__(self, state: AppState, on_import_complete: callable | None = None, parent: QWidget | None = None) -> None:
         super().__init__(parent)
@@ -109,21 +171,28 @@ class ImportPage(QFrame):
         self.on_import_complete = on_import_complete
         self.setObjectName("Import")
         self._tip_shown: bool = False
+        self._load_thread: QThread | None = None
+        self._load_worker: _CsvLoadWorker | None = None
+        self._pending_files: List[str] = []
 
         layout = QVBoxLayout(self)
         title = QLabel("Import FortiManager CSV Exports", self)
         title.setAlignment(Qt.AlignmentFlag.AlignLeft)
         open_btn = PrimaryPushButton("Open CSVs", self)
         open_btn.clicked.connect(self._open_files)
+        self._open_btn = open_btn
         self._cfg_btn = PrimaryPushButton("(Optional) Open FortiGate Configs", self)
         self._cfg_btn.clicked.connect(self._open_configs)
         self._status = QLabel("No files loaded", self)
         self._status.setWordWrap(True)
+        self._progress = IndeterminateProgressBar(self, start=False)
+        self._progress.setVisible(False)
 
         layout.addWidget(title)
         layout.addWidget(open_btn)
         layout.addWidget(self._cfg_btn)
         layout.addWidget(self._status)
+        layout.addWidget(self._progress)
 
         # Teaching tip is shown after the page is visible to avoid geometry errors
 
@@ -134,24 +203,70 @@ class ImportPage(QFrame):
             os.getcwd(),
             "CSV Files (*.csv)"
         )
-        if not files:
+        if not files or self._load_thread is not None:
             return
+        # Parse on a worker thread so the window stays responsive on large exports
+        self._pending_files = list(files)
+        self._open_btn.setEnabled(False)
+        self._status.setText(f"Reading {len(files)} files...")
+        self._progress.setVisible(True)
+        self._progress.start()
+        thread = QThread(self)
+        worker = _CsvLoadWorker(files)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.progress.connect(self._on_load_progress)
+        worker.loaded.connect(self._on_files_loaded)
+        worker.failed.connect(self._on_load_failed)
+        worker.loaded.connect(thread.quit)
+        worker.failed.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(self._on_load_thread_finished)
+        self._load_thread = thread
+        self._load_worker = worker
+        thread.start()
+
+    def wait_for_load(self) -> None:
+        """Block until an in-flight import finishes, so its thread is never destroyed while running."""
+        thread = self._load_thread
+        if thread is not None:
+            thread.quit()
+            thread.wait()
+
+    @pyqtSlot(int, int)
+    def _on_load_progress(self, done: int, total: int) -> None:
+        self._status.setText(f"Reading files... {done}/{total}")
+
+    @pyqtSlot(str)
+    def _on_load_failed(self, message: str) -> None:
+        self._status.setText("No files loaded")
+        QMessageBox.critical(self, "Error", message)
+
+    @pyqtSlot()
+    def _on_load_thread_finished(self) -> None:
+        if self._load_thread is not None:
+            self._load_thread.deleteLater()
+        self._load_thread = None
+        self._load_worker = None
+        self._progress.stop()
+        self._progress.setVisible(False)
+        self._open_btn.setEnabled(True)
+
+    @pyqtSlot(list, dict)
+    def _on_files_loaded(self, policy_sets: List[PolicySet], dup_groups: Dict[Tuple[str, str, str, str, str], List]) -> None:
+        files = self._pending_files
         try:
-            policy_sets = [read_policy_csv(path) for path in files]
-            # Do NOT dedupe automatically. Build model with all rules and compute duplicate groups for preview only.
-            all_rules = [r for ps in policy_sets for r in ps.rules]
+            # Do NOT dedupe automatically. Build model with all rules; duplicate groups are for preview only.
+            # Rules are streamed straight from the per-file sets; no flattened copy is kept.
             display_columns = policy_sets[0].columns if policy_sets and policy_sets[0].columns else []
             ps_display = PolicySet(source_fortigate="MERGED", columns=display_columns)
-            for r in all_rules:
-                ps_display.add_rule(r.raw)
+            ps_display.add_rules(r.raw for ps in policy_sets for r in ps.rules)
             self.state.policy_sets = [ps_display]
             self.state.model.set_policy_sets(self.state.policy_sets)
-            # compute groups for dedupe review (no changes applied yet)
-            dup_groups = group_duplicates_by_five_fields(all_rules)
             self.state.duplicate_groups = dup_groups
             # reset resolved markers on new import
             self.state.resolved_duplicate_keys.clear()
-            total_rules = len(all_rules)
+            total_rules = len(ps_display.rules)
             dup_groups_count = sum(max(len(v) - 1, 0) for v in dup_groups.values())
             self._status.setText(
                 f"Loaded {total_rules} rules from {len(files)} files (potential {dup_groups_count} duplicates across {len(dup_groups)} groups to review)."
@@ -236,7 +351,7 @@ class ReviewPage(QFrame):
         self._btn_system_accent = PrimaryPushButton("System Accent", self)
         self._btn_pick_accent = PrimaryPushButton("Pick Accent", self)
         self._btn_continue_final = PrimaryPushButton("Continue ➜ Final Review", self)
-        self._btn_refresh.clicked.connect(self._refresh_suggestions)
+        self._btn_refresh.clicked.connect(self._on_refresh_clicked)
         self._btn_resolve.clicked.connect(self._resolve_suggestions)
         self._btn_compare.clicked.connect(self._compare_selected)
         self._btn_toggle_columns.toggled.connect(self._on_toggle_columns)
@@ -272,9 +387,12 @@ class ReviewPage(QFrame):
         left.setContentsMargins(0, 0, 0, 0)
         left.setSpacing(8)
         left.addWidget(self._table)
-        self._details = QTableWidget(self)
-        self._details.setColumnCount(2)
-        self._details.setHorizontalHeaderLabels(["Field", "Value"])
+        self._details = QTableView(self)
+        self._details_model = RuleDetailsModel(self._details)
+        self._details.setModel(self._details_model)
+        details_header = self._details.horizontalHeader()
+        details_header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        details_header.setStretchLastSection(True)
         left.addWidget(self._details)
 
         # Right panel: suggestions and decisions
@@ -290,6 +408,8 @@ class ReviewPage(QFrame):
         self._chip_layout = QHBoxLayout(self._chip_frame)
         self._chip_layout.setContentsMargins(0, 0, 0, 0)
         self._chip_layout.setSpacing(6)
+        # Chips are pooled: re-labelled and shown/hidden instead of recreated per click
+        self._chip_pool: List[PillPushButton] = []
 
         # Guided suggestion UI
         self._suggestion_title = QLabel("", self)
@@ -342,27 +462,23 @@ class ReviewPage(QFrame):
         layout.addLayout(header)
         layout.addLayout(content)
 
-        self._current_groups = {}
-        self._group_keys: List[tuple] = []
+        # Suggestion groups in display order, indexed by list row
+        self._groups: List[Tuple[tuple, List[SimilaritySuggestion]]] = []
+        # Pairs of the selected group
+        self._current_pairs: List[SimilaritySuggestion] = []
+        self._current_pair_index: int = -1
         self._proposal_index: int = -1
+        # (model generation, single-field merge groups) from the last refresh
+        self._merge_groups_cache: Tuple[int, list] | None = None
+        # Inputs the current proposals were built from: (generation, decision count, catalog object).
+        # The catalog is held by reference and compared with `is`; an id() could be reused after a re-import.
+        self._proposals_state: Tuple[int, int, Any] | None = None
         self._is_dark: bool = False
 
         # Wire selection changes
         self._table.selectionModel().selectionChanged.connect(self._update_details_from_selected_row)
         # Set compact default columns (identity fields) for review
-        identity_cols = [
-            "name",
-            "srcintf",
-            "dstintf",
-            "srcaddr",
-            "dstaddr",
-            "service",
-            "schedule",
-            "action",
-            "nat",
-        ]
-        available = self.state.model.all_columns()
-        compact = [c for c in identity_cols if c in available]
+        compact = self.state.model.compact_columns()
         if compact:
             self.state.model.set_display_columns(compact)
         self._update_details_from_selected_row()
@@ -415,7 +531,6 @@ class ReviewPage(QFrame):
 
     def _pick_accent(self) -> None:
         try:
-            from PyQt6.QtGui import QColor
             dlg = ColorDialog(QColor(0, 120, 215), "Choose Accent Color", self, enableAlpha=False)
             if dlg.exec():
                 color = dlg.color()
@@ -444,16 +559,24 @@ class ReviewPage(QFrame):
         if self.state.model.rowCount() == 0:
             QMessageBox.information(self, "No data", "Load CSVs first")
             return
-        # Use single-field group merge suggestions for simple UX
-        merge_groups = find_group_merge_suggestions_single_field(self.state.model._rules)
+        # Use single-field group merge suggestions for simple UX; reuse them while the rules are unchanged
+        generation = self.state.model.generation()
+        if self._merge_groups_cache is not None and self._merge_groups_cache[0] == generation:
+            merge_groups = self._merge_groups_cache[1]
+        else:
+            merge_groups = find_group_merge_suggestions_single_field(self.state.model._rules)  # type: ignore[attr-defined]
+            self._merge_groups_cache = (generation, merge_groups)
         self._proposals = []
+        # Build union using catalog-aware names when available to avoid splitting multi-token objects
+        catalog = getattr(self.state, 'object_catalog', None)
+        self._proposals_state = self._suggestion_inputs()
+        addr_known = catalog.address_names() if catalog else set()
+        svc_known = catalog.service_names() if catalog else set()
         for mg in merge_groups:
             key_tuple = ('single_field', mg.varying_field, tuple(mg.base_key), tuple(mg.context))
             # Skip groups already decided
             if key_tuple in self.state.suggestion_group_decisions:
                 continue
-            # Build union using catalog-aware names when available to avoid splitting multi-token objects
-            catalog = getattr(self.state, 'object_catalog', None)
             union_names: list[str] = []
             seen: set[str] = set()
             names: List[str] = []
@@ -461,11 +584,9 @@ class ReviewPage(QFrame):
             for r in mg.rules:
                 val = (r.raw.get(mg.varying_field, '') or '')
                 if catalog and mg.varying_field in ("srcaddr", "dstaddr"):
-                    known = set(catalog.addresses.keys()) | set(catalog.addr_groups.keys()) | set(catalog.vips.keys())
-                    parts = _map_tokens_with_catalog(val, known)
+                    parts = _map_tokens_with_catalog(val, addr_known)
                 elif catalog and mg.varying_field == "service":
-                    known = set(catalog.services.keys()) | set(catalog.service_groups.keys())
-                    parts = _map_tokens_with_catalog(val, known)
+                    parts = _map_tokens_with_catalog(val, svc_known)
                 else:
                     parts = [p for p in val.split() if p]
                 # dominance
@@ -477,14 +598,14 @@ class ReviewPage(QFrame):
                     if p not in seen:
                         seen.add(p)
                         union_names.append(p)
-                names.append((r.raw.get('name','') or '').strip())
+                names.append(r.clean('name'))
                 sources.add(r.source_fortigate)
             preview_lines = []
             for f in FIVE_FIELDS:
                 if f == mg.varying_field:
                     preview_lines.append(f"{f}: {' '.join(union_names)}")
                 else:
-                    preview_lines.append(f"{f}: {(mg.rules[0].raw.get(f,'') or '').strip()}")
+                    preview_lines.append(f"{f}: {mg.rules[0].clean(f)}")
             desc = f"{len(mg.rules)} rule(s) differ only in '{mg.varying_field}'. Proposed merge will union that field."
             display_name = next((n for n in names if n), "(unnamed)")
             self._proposals.append({'key': key_tuple,
@@ -524,6 +645,37 @@ class ReviewPage(QFrame):
             self._proposal_index = resume_idx
         self._show_current_proposal()
 
+    def _invalidate_suggestions(self) -> None:
+        """Drop cached merge groups after rules were edited in place (renames, merges)."""
+        self._merge_groups_cache = None
+        self._proposals_state = None
+
+    def _suggestion_inputs(self) -> Tuple[int, int, Any]:
+        catalog = getattr(self.state, 'object_catalog', None)
+        return (self.state.model.generation(), len(self.state.suggestion_group_decisions), catalog)
+
+    def _proposals_up_to_date(self) -> bool:
+        if self._proposals_state is None:
+            return False
+        generation, decisions, catalog = self._suggestion_inputs()
+        built = self._proposals_state
+        return built[0] == generation and built[1] == decisions and built[2] is catalog
+
+    def _on_refresh_clicked(self) -> None:
+        # Nothing changed since the proposals were built: keep them (and the current position)
+        if self._proposals_up_to_date():
+            InfoBar.info(
+                title='Up to date',
+                content='Suggestions already reflect the current rules.',
+                orient=Qt.Orientation.Horizontal,
+                isClosable=True,
+                position=InfoBarPosition.TOP_RIGHT,
+                duration=2000,
+                parent=self
+            )
+            return
+        self._refresh_suggestions()
+
     def _compare_selected(self) -> None:
         sel = self._table.selectionModel().selectedRows()
         if len(sel) != 2:
@@ -563,76 +715,68 @@ class ReviewPage(QFrame):
                 removed_ids.add(id(s.rule_a))
                 self.state.audit_log.append({"action": "keep_b", "reason": build_suggestion_reason(s)})
             elif choice == "keep_both":
-                name_b = s.rule_b.raw.get("name", "").strip()
+                name_b = s.rule_b.clean("name")
                 s.rule_b.raw["name"] = f"{name_b}-from-{s.rule_b.source_fortigate}" if name_b else f"rule-from-{s.rule_b.source_fortigate}"
+                s.rule_b.invalidate_cache()
                 self.state.audit_log.append({"action": "keep_both", "reason": build_suggestion_reason(s)})
             elif choice == "merge_into_a":
                 # Use selected fields from dialog if provided
-                fields = tuple(dlg.selected_fields) if getattr(dlg, 'selected_fields', None) else ("srcaddr", "dstaddr", "service")
+                fields = tuple(dlg.selected_fields) if getattr(dlg, 'selected_fields', None) else DEFAULT_MERGE_FIELDS
                 merged = merge_fields(s.rule_a, s.rule_b, fields=fields)
                 s.rule_a.raw.update(merged)
+                s.rule_a.invalidate_cache()
                 removed_ids.add(id(s.rule_b))
                 self.state.audit_log.append({"action": "merge_into_a", "fields": list(fields), "reason": build_suggestion_reason(s)})
             elif choice == "merge_into_b":
-                fields = tuple(dlg.selected_fields) if getattr(dlg, 'selected_fields', None) else ("srcaddr", "dstaddr", "service")
+                fields = tuple(dlg.selected_fields) if getattr(dlg, 'selected_fields', None) else DEFAULT_MERGE_FIELDS
                 merged = merge_fields(s.rule_b, s.rule_a, fields=fields)
                 s.rule_b.raw.update(merged)
+                s.rule_b.invalidate_cache()
                 removed_ids.add(id(s.rule_a))
                 self.state.audit_log.append({"action": "merge_into_b", "fields": list(fields), "reason": build_suggestion_reason(s)})
+        # keep_both renames and merges edit rules in place
+        self._invalidate_suggestions()
         if removed_ids:
-            remaining = [r for r in self.state.model._rules if id(r) not in removed_ids]  # type: ignore[attr-defined]
-            from policy_merger.models import PolicySet
-            ps = PolicySet(source_fortigate="MERGED", columns=self.state.model._columns)  # type: ignore[attr-defined]
-            for r in remaining:
-                ps.add_rule(r.raw)
-            self.state.model.set_policy_sets([ps])
+            self._remove_rules(removed_ids)
             # refresh pairs/chips view
             self._on_group_selected(self._groups_list.currentRow())
         # after resolving suggestions, prompt to move to final review
         # All group decisions are explicit via group buttons; mark confirmed once no groups remain
-        if self.on_continue and not self._current_groups:
+        if self.on_continue and not self._groups:
             done = QMessageBox.question(self, "Suggestions complete", "All suggestion groups decided. Proceed to Final Review?")
             if done == QMessageBox.StandardButton.Yes:
                 self.state.suggestions_confirmed = True
                 self.on_continue()
 
     def _on_group_selected(self, row: int) -> None:
-        self._current_group_index = row
-        self._pairs_list.clear()
         self._clear_chips()
-        if row < 0 or row >= len(self._group_keys):
+        if row < 0 or row >= len(self._groups):
+            self._current_pairs = []
+            _fill_list(self._pairs_list, [])
             return
-        key = self._group_keys[row]
-        suggestions = self._current_groups.get(key, [])
+        suggestions = self._current_pairs = self._groups[row][1]
+        labels: List[str] = []
         for i, s in enumerate(suggestions, start=1):
-            a_name = (s.rule_a.raw.get('name', '') or '').strip()
-            b_name = (s.rule_b.raw.get('name', '') or '').strip()
+            a_name = s.rule_a.clean('name')
+            b_name = s.rule_b.clean('name')
             a_src = s.rule_a.source_fortigate
             b_src = s.rule_b.source_fortigate
-            fields = ','.join(sorted(s.field_diffs.keys())) if s.field_diffs else '(identical)'
-            self._pairs_list.addItem(f"Pair {i}: A:{a_name} ({a_src}) vs B:{b_name} ({b_src}) | diffs: {fields}")
+            fields = ','.join(s.diff_fields) or '(identical)'
+            labels.append(f"Pair {i}: A:{a_name} ({a_src}) vs B:{b_name} ({b_src}) | diffs: {fields}")
+        _fill_list(self._pairs_list, labels)
 
     def _on_pair_selected(self, row: int) -> None:
         self._current_pair_index = row
         self._clear_chips()
-        if self._current_group_index < 0 or self._current_group_index >= len(self._group_keys):
-            return
-        key = self._group_keys[self._current_group_index]
-        suggestions = self._current_groups.get(key, [])
-        if row < 0 or row >= len(suggestions):
+        if row < 0 or row >= len(self._current_pairs):
             return
-        s = suggestions[row]
-        fields = sorted(s.field_diffs.keys()) if s.field_diffs else []
+        s = self._current_pairs[row]
+        fields = list(s.diff_fields)
         if not fields:
-            chip = PillPushButton('identical', self._chip_frame)
-            chip.setEnabled(False)
-            self._chip_layout.addWidget(chip)
+            self._show_chips(['identical'])
             self._preview_label.setText("These rules are identical on the five fields; no merge needed.")
             return
-        for f in fields:
-            chip = PillPushButton(f, self._chip_frame)
-            chip.setEnabled(False)
-            self._chip_layout.addWidget(chip)
+        self._show_chips(fields)
         # Show reason as InfoBar
         InfoBar.info(
             title='Why suggested',
@@ -646,8 +790,8 @@ class ReviewPage(QFrame):
         # Show preview summary of resulting values for five fields (union)
         preview_bits = []
         for f in sorted(fields):
-            av = (s.rule_a.raw.get(f, '') or '').strip()
-            bv = (s.rule_b.raw.get(f, '') or '').strip()
+            av = s.rule_a.clean(f)
+            bv = s.rule_b.clean(f)
             # naive union preview (space-delimited)
             aset = {x for x in av.split() if x}
             bset = {x for x in bv.split() if x}
@@ -657,19 +801,7 @@ class ReviewPage(QFrame):
 
     def _on_toggle_columns(self, checked: bool) -> None:
         if checked:
-            identity_cols = [
-                "name",
-                "srcintf",
-                "dstintf",
-                "srcaddr",
-                "dstaddr",
-                "service",
-                "schedule",
-                "action",
-                "nat",
-            ]
-            available = self.state.model.all_columns()
-            compact = [c for c in identity_cols if c in available]
+            compact = self.state.model.compact_columns()
             self.state.model.set_display_columns(compact)
         else:
             self.state.model.set_display_columns(None)
@@ -679,23 +811,13 @@ class ReviewPage(QFrame):
         # Show details for first selected row
         sel = self._table.selectionModel().selectedRows()
         if not sel:
-            self._details.clearContents()
-            self._details.setRowCount(0)
+            self._details_model.set_rule(None, [])
             return
         row = sel[0].row()
         try:
             rule = self.state.model._rules[row]  # type: ignore[attr-defined]
             columns = self.state.model._columns  # type: ignore[attr-defined]
-            self._details.setRowCount(len(columns))
-            for i, col in enumerate(columns):
-                item_field = QTableWidgetItem(col)
-                val = (rule.raw.get(col, "") or "").strip()
-                item_val = QTableWidgetItem(val)
-                item_field.setFlags(Qt.ItemFlag.ItemIsEnabled)
-                item_val.setFlags(Qt.ItemFlag.ItemIsEnabled)
-                self._details.setItem(i, 0, item_field)
-                self._details.setItem(i, 1, item_val)
-            self._details.resizeColumnsToContents()
+            self._details_model.set_rule(rule, columns)
         except Exception:
             pass
 
@@ -704,21 +826,31 @@ class ReviewPage(QFrame):
         self._is_dark = not self._is_dark
         setTheme(Theme.DARK if self._is_dark else Theme.LIGHT)
 
+    def _show_chips(self, labels: List[str]) -> None:
+        self._chip_frame.setUpdatesEnabled(False)
+        try:
+            for i, text in enumerate(labels):
+                if i < len(self._chip_pool):
+                    chip = self._chip_pool[i]
+                    chip.setText(text)
+                else:
+                    chip = PillPushButton(text, self._chip_frame)
+                    chip.setEnabled(False)
+                    self._chip_layout.addWidget(chip)
+                    self._chip_pool.append(chip)
+                chip.show()
+            for chip in self._chip_pool[len(labels):]:
+                chip.hide()
+        finally:
+            self._chip_frame.setUpdatesEnabled(True)
+
     def _clear_chips(self) -> None:
-        while self._chip_layout.count():
-            item = self._chip_layout.takeAt(0)
-            w = item.widget()
-            if w is not None:
-                w.deleteLater()
+        self._show_chips([])
 
     def _open_selected_pair_diff(self) -> None:
-        if self._current_group_index < 0 or self._current_group_index >= len(self._group_keys):
+        if self._current_pair_index < 0 or self._current_pair_index >= len(self._current_pairs):
             return
-        key = self._group_keys[self._current_group_index]
-        suggestions = self._current_groups.get(key, [])
-        if self._current_pair_index < 0 or self._current_pair_index >= len(suggestions):
-            return
-        s = suggestions[self._current_pair_index]
+        s = self._current_pairs[self._current_pair_index]
         columns = self.state.model._columns  # type: ignore[attr-defined]
         dlg = DiffDialog(s.rule_a, s.rule_b, columns, self)
         dlg.exec()
@@ -728,11 +860,11 @@ class ReviewPage(QFrame):
         self._apply_group_decision(action)
 
     def _apply_group_decision(self, action: str) -> None:
-        if self._groups_list.currentRow() < 0 or not self._group_keys:
+        row = self._groups_list.currentRow()
+        if row < 0 or row >= len(self._groups):
             QMessageBox.information(self, "Select group", "Please select a suggestion group first")
             return
-        key = self._group_keys[self._groups_list.currentRow()]
-        suggestions = self._current_groups.get(key, [])
+        key, suggestions = self._groups[row]
         if not suggestions:
             QMessageBox.information(self, "Empty group", "No suggestions in the selected group")
             return
@@ -757,28 +889,38 @@ class ReviewPage(QFrame):
                 removed_ids.add(id(s.rule_a))
                 self.state.audit_log.append({"action": "group_keep_b", "reason": build_suggestion_reason(s)})
             elif action == "keep_both":
-                name_b = s.rule_b.raw.get("name", "").strip()
+                name_b = s.rule_b.clean("name")
                 s.rule_b.raw["name"] = f"{name_b}-from-{s.rule_b.source_fortigate}" if name_b else f"rule-from-{s.rule_b.source_fortigate}"
+                s.rule_b.invalidate_cache()
                 self.state.audit_log.append({"action": "group_keep_both", "reason": build_suggestion_reason(s)})
             elif action == "merge_into_a":
-                merged = merge_fields(s.rule_a, s.rule_b, fields=("srcaddr", "dstaddr", "service"))
+                merged = merge_fields(s.rule_a, s.rule_b, fields=DEFAULT_MERGE_FIELDS)
                 s.rule_a.raw.update(merged)
+                s.rule_a.invalidate_cache()
                 removed_ids.add(id(s.rule_b))
-                self.state.audit_log.append({"action": "group_merge_into_a", "fields": ["srcaddr","dstaddr","service"], "reason": build_suggestion_reason(s)})
+                self.state.audit_log.append({"action": "group_merge_into_a", "fields": list(DEFAULT_MERGE_FIELDS), "reason": build_suggestion_reason(s)})
             elif action == "merge_into_b":
-                merged = merge_fields(s.rule_b, s.rule_a, fields=("srcaddr", "dstaddr", "service"))
+                merged = merge_fields(s.rule_b, s.rule_a, fields=DEFAULT_MERGE_FIELDS)
                 s.rule_b.raw.update(merged)
+                s.rule_b.invalidate_cache()
                 removed_ids.add(id(s.rule_a))
-                self.state.audit_log.append({"action": "group_merge_into_b", "fields": ["srcaddr","dstaddr","service"], "reason": build_suggestion_reason(s)})
+                self.state.audit_log.append({"action": "group_merge_into_b", "fields": list(DEFAULT_MERGE_FIELDS), "reason": build_suggestion_reason(s)})
         if removed_ids:
-            remaining = [r for r in self.state.model._rules if id(r) not in removed_ids]  # type: ignore[attr-defined]
-            from policy_merger.models import PolicySet as _PS
-            ps = _PS(source_fortigate="MERGED", columns=self.state.model._columns)  # type: ignore[attr-defined]
-            for r in remaining:
-                ps.add_rule(r.raw)
-            self.state.model.set_policy_sets([ps])
+            # Drop the removed rows in place and prune pairs that referenced them
+            self._remove_rules(removed_ids)
+            groups = []
+            for group_key, group in self._groups:
+                kept = [x for x in group if id(x.rule_a) not in removed_ids and id(x.rule_b) not in removed_ids]
+                if kept:
+                    groups.append((group_key, kept))
+            self._groups = groups
         # record decision and refresh list
         self.state.suggestion_group_decisions[key] = action
+        if removed_ids:
+            self._invalidate_suggestions()
+        else:
+            # keep_both only renames; merge groups ignore names, so just rebuild the proposals
+            self._proposals_state = None
         self._refresh_suggestions()
 
     def _show_current_proposal(self) -> None:
@@ -792,32 +934,20 @@ class ReviewPage(QFrame):
         self._suggestion_desc.setText(str(p['desc']))
         # Fill rule table
         rules = p.get('rules', [])
-        self._rules_table.setRowCount(len(rules))
-        for row, r in enumerate(rules):
-            values = [
-                (r.raw.get('name','') or '').strip(),
-                (r.raw.get('srcaddr','') or '').strip(),
-                (r.raw.get('dstaddr','') or '').strip(),
-                (r.raw.get('srcintf','') or '').strip(),
-                (r.raw.get('dstintf','') or '').strip(),
-                (r.raw.get('service','') or '').strip(),
-            ]
-            for col, val in enumerate(values):
-                item = QTableWidgetItem(val)
-                item.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable)
-                self._rules_table.setItem(row, col, item)
-        self._rules_table.resizeColumnsToContents()
+        _fill_table(
+            self._rules_table,
+            [[r.clean(f) for f in ('name', 'srcaddr', 'dstaddr', 'srcintf', 'dstintf', 'service')] for r in rules],
+            Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable,
+        )
         # Fill union preview table
-        union_lines = [ln.strip() for ln in str(p['preview']).split('\n') if ln.strip()]
-        self._union_table.setRowCount(len(union_lines))
-        for row, ln in enumerate(union_lines):
-            if ':' in ln:
-                field, val = ln.split(':', 1)
-            else:
-                field, val = ln, ''
-            self._union_table.setItem(row, 0, QTableWidgetItem(field.strip()))
-            self._union_table.setItem(row, 1, QTableWidgetItem(val.strip()))
-        self._union_table.resizeColumnsToContents()
+        union_rows = []
+        for ln in str(p['preview']).split('\n'):
+            ln = ln.strip()
+            if not ln:
+                continue
+            field, _, val = ln.partition(':')
+            union_rows.append((field.strip(), val.strip()))
+        _fill_table(self._union_table, union_rows)
         # Default name suggestion
         self._name_edit.setText(p.get('name', ''))
         # Enable merge only when name present
@@ -849,11 +979,11 @@ class ReviewPage(QFrame):
             catalog = getattr(self.state, 'object_catalog', None)
             parts_all: list[str] = []
             if catalog and varying in ("srcaddr", "dstaddr"):
-                known = set(catalog.addresses.keys()) | set(catalog.addr_groups.keys()) | set(catalog.vips.keys())
+                known = catalog.address_names()
                 for r in rules:
                     parts_all.extend(_map_tokens_with_catalog((r.raw.get(varying, '') or ''), known))
             elif catalog and varying == "service":
-                known = set(catalog.services.keys()) | set(catalog.service_groups.keys())
+                known = catalog.service_names()
                 for r in rules:
                     parts_all.extend(_map_tokens_with_catalog((r.raw.get(varying, '') or ''), known))
             else:
@@ -875,31 +1005,29 @@ class ReviewPage(QFrame):
                 base.raw[varying] = ' '.join(ordered_names)
             if merged_name:
                 base.raw['name'] = merged_name
+            base.invalidate_cache()
             # Remove other rules in the group by raw-identity to survive model rebuilds
             removed_raw_ids = {id(r.raw) for r in rules[1:]}
-            remaining = [r for r in self.state.model._rules if id(r.raw) not in removed_raw_ids]  # type: ignore[attr-defined]
-            from policy_merger.models import PolicySet as _PS
-            ps = _PS(source_fortigate="MERGED", columns=self.state.model._columns)  # type: ignore[attr-defined]
-            for r in remaining:
-                ps.add_rule(r.raw)
-            self.state.model.set_policy_sets([ps])
+            self._remove_rules_by_raw_id(removed_raw_ids)
             self.state.suggestion_group_decisions[key] = "accept"
             # Recompute suggestions and resume from next item
             self._resume_from_index = self._proposal_index
+            self._invalidate_suggestions()
             self._refresh_suggestions()
             return
         # Legacy pair-based fallback
-        suggestions = self._current_groups.get(key, [])
+        suggestions = next((group for group_key, group in self._groups if group_key == key), [])
         removed_raw_ids = set()
+        catalog = getattr(self.state, 'object_catalog', None)
+        if catalog:
+            addr_known = catalog.address_names()
+            svc_known = catalog.service_names()
         for s in suggestions:
             # union five fields into the first rule (rule_a)
             merged = merge_fields(s.rule_a, s.rule_b, fields=("srcaddr", "dstaddr", "srcintf", "dstintf", "service"))
             s.rule_a.raw.update(merged)
             # Normalize with catalog-aware grouping for addr/service fields
-            catalog = getattr(self.state, 'object_catalog', None)
             if catalog:
-                addr_known = set(catalog.addresses.keys()) | set(catalog.addr_groups.keys()) | set(catalog.vips.keys())
-                svc_known = set(catalog.services.keys()) | set(catalog.service_groups.keys())
                 for fld in ("srcaddr", "dstaddr"):
                     parts = _map_tokens_with_catalog(s.rule_a.raw.get(fld, ''), addr_known)
                     if any(p.lower() in ("all", "any") for p in parts):
@@ -926,19 +1054,30 @@ class ReviewPage(QFrame):
                     s.rule_a.raw['service'] = ' '.join(ordered)
             if merged_name:
                 s.rule_a.raw["name"] = merged_name
+            s.rule_a.invalidate_cache()
             removed_raw_ids.add(id(s.rule_b.raw))
             self.state.audit_log.append({"action": "guided_merge_accept", "reason": build_suggestion_reason(s)})
         if removed_raw_ids:
-            remaining = [r for r in self.state.model._rules if id(r.raw) not in removed_raw_ids]  # type: ignore[attr-defined]
-            from policy_merger.models import PolicySet as _PS
-            ps = _PS(source_fortigate="MERGED", columns=self.state.model._columns)  # type: ignore[attr-defined]
-            for r in remaining:
-                ps.add_rule(r.raw)
-            self.state.model.set_policy_sets([ps])
+            self._remove_rules_by_raw_id(removed_raw_ids)
         self.state.suggestion_group_decisions[key] = "accept"
         self._resume_from_index = self._proposal_index
+        self._invalidate_suggestions()
         self._refresh_suggestions()
 
+    def _remove_rules(self, rule_ids: Set[int]) -> None:
+        # Each removed run can emit selectionChanged; refresh the details panel once instead
+        blocker = QSignalBlocker(self._table.selectionModel())
+        try:
+            self.state.model.remove_rules_by_id(rule_ids)
+        finally:
+            blocker.unblock()
+        self._update_details_from_selected_row()
+
+    def _remove_rules_by_raw_id(self, raw_ids: Set[int]) -> None:
+        # Rows are removed in place (no model reset), so merged rules keep their objects
+        rules = self.state.model._rules  # type: ignore[attr-defined]
+        self._remove_rules({id(r) for r in rules if id(r.raw) in raw_ids})
+
     def _deny_current_proposal(self) -> None:
         if self._proposal_index < 0 or self._proposal_index >= len(self._proposals):
             return
@@ -1019,8 +1158,8 @@ class ExportPage(QFrame):
             # Pre-export validation against loaded configs (if provided)
             catalog = getattr(self.state, 'object_catalog', None)
             if catalog is not None:
-                addr_known = set(catalog.addresses.keys()) | set(catalog.addr_groups.keys()) | set(catalog.vips.keys())
-                svc_known = set(catalog.services.keys()) | set(catalog.service_groups.keys())
+                addr_known = catalog.address_names()
+                svc_known = catalog.service_names()
                 unknown: list[str] = []
                 for r in rules:
                     for fld, known in (("srcaddr", addr_known), ("dstaddr", addr_known)):
@@ -1043,13 +1182,19 @@ class ExportPage(QFrame):
                                          + "\n".join(unknown[:50]) + ("\n..." if len(unknown) > 50 else ""))
                     return
             # Emit policies only for now
-            cli_text = generate_fgt_cli(rules, catalog=catalog, include_objects=False)
-            # If the generator inserted rename comments, inform user via status
-            renamed = [ln for ln in cli_text.splitlines() if ln.startswith('# ') and '->' in ln]
+            # Stream to a temp file beside the target and swap it in only once complete,
+            # so a failure leaves any existing script untouched
+            tmp_out = out + ".part"
+            try:
+                with open(tmp_out, "w", encoding="utf-8") as f:
+                    renamed = stream_fgt_cli(rules, f, catalog=catalog, include_objects=False)
+                os.replace(tmp_out, out)
+            except BaseException:
+                if os.path.exists(tmp_out):
+                    os.remove(tmp_out)
+                raise
             if renamed:
                 InfoBar.info(title='Policy names adjusted', content=f"{len(renamed)} duplicate names were suffixed to ensure uniqueness (max 35 chars).", orient=Qt.Orientation.Horizontal, isClosable=True, position=InfoBarPosition.TOP_RIGHT, duration=4000, parent=self)
-            with open(out, "w", encoding="utf-8") as f:
-                f.write(cli_text)
             self._status.setText(f"Wrote CLI script to {out}")
             QMessageBox.information(self, "Exported", f"Wrote CLI script to {out}")
         except Exception as e:
@@ -1089,10 +1234,8 @@ class ExportPage(QFrame):
             cols = data.get("columns", [])
             rules = data.get("rules", [])
             self.state.audit_log = data.get("audit_log", [])
-            from policy_merger.models import PolicySet as _PS
-            ps = _PS(source_fortigate="SESSION", columns=cols)
-            for row in rules:
-                ps.add_rule(row)
+            ps = PolicySet(source_fortigate="SESSION", columns=cols)
+            ps.add_rules(rules)
             self.state.model.set_policy_sets([ps])
             InfoBar.success(title='Session loaded', content=path, orient=Qt.Orientation.Horizontal, isClosable=True, position=InfoBarPosition.TOP_RIGHT, duration=2000, parent=self)
         except Exception as e:
@@ -1148,6 +1291,8 @@ class DedupePage(QFrame):
         self._btn_undo.clicked.connect(self._undo)
         self._btn_continue.clicked.connect(self._confirm_and_continue)
 
+        # Keys of the groups listed in _groups_list, by row; rebuilt in _load_groups
+        self._group_keys: List[Tuple[str, str, str, str, str]] = []
         self._load_groups()
 
     def showEvent(self, e) -> None:  # type: ignore[override]
@@ -1171,17 +1316,21 @@ class DedupePage(QFrame):
             pass
 
     def _load_groups(self) -> None:
-        self._groups_list.clear()
         count = 0
         total_duplicates = 0
+        labels: List[str] = []
+        group_keys: List[Tuple[str, str, str, str, str]] = []
         for key, items in self.state.duplicate_groups.items():
             if len(items) <= 1:
                 continue
+            group_keys.append(key)
             count += 1
             total_duplicates += len(items) - 1
             summary = "; ".join(f"{f}={v}" for f, v in zip(FIVE_FIELDS, key))
             suffix = " (resolved)" if key in self.state.resolved_duplicate_keys else ""
-            self._groups_list.addItem(f"Group {count} ({len(items)} rules): {summary}{suffix}")
+            labels.append(f"Group {count} ({len(items)} rules): {summary}{suffix}")
+        self._group_keys = group_keys
+        _fill_list(self._groups_list, labels)
         if count == 0:
             InfoBar.info(
                 title='No duplicates',
@@ -1217,37 +1366,35 @@ class DedupePage(QFrame):
     def _apply_keep_first_for_keys(self, keys: List[Tuple[str, str, str, str, str]]) -> None:
         # Helper to remove later duplicates for provided duplicate-group keys
         self.state.snapshot_model()
-        from policy_merger.models import PolicySet as _PS
         current_cols = self.state.model._columns  # type: ignore[attr-defined]
-        ps = _PS(source_fortigate="MERGED", columns=current_cols)
+        ps = PolicySet(source_fortigate="MERGED", columns=current_cols)
         drop_ids = set()
         for key in keys:
             items = self.state.duplicate_groups.get(key, [])
             for dup in items[1:]:
                 drop_ids.add(id(dup.raw))
-        for r in self.state.model._rules:  # type: ignore[attr-defined]
-            if id(r.raw) in drop_ids:
-                continue
-            ps.add_rule(r.raw)
+        ps.add_rules(r.raw for r in self.state.model._rules if id(r.raw) not in drop_ids)  # type: ignore[attr-defined]
         self.state.model.set_policy_sets([ps])
         for k in keys:
             self.state.resolved_duplicate_keys.add(k)
 
     def _on_group_selected(self, row: int) -> None:
-        self._items_list.clear()
         if row < 0:
+            self._items_list.clear()
             return
-        # Map row to corresponding key
-        keys = [k for k, v in self.state.duplicate_groups.items() if len(v) > 1]
-        if row >= len(keys):
+        if row >= len(self._group_keys):
+            self._items_list.clear()
             return
-        key = keys[row]
+        key = self._group_keys[row]
         items = self.state.duplicate_groups.get(key, [])
+        labels: List[str] = []
         for idx, r in enumerate(items):
+            # Group members share raw dicts with the table's rules, so read raw rather than the per-rule cache
             name = (r.raw.get('name', '') or '').strip()
             src = r.source_fortigate
             prefix = "[kept]" if idx == 0 else "[dup]"
-            self._items_list.addItem(f"{prefix} {name or '(no name)'} — {src}")
+            labels.append(f"{prefix} {name or '(no name)'} — {src}")
+        _fill_list(self._items_list, labels)
 
     def _keep_first(self) -> None:
         InfoBar.success(
@@ -1261,9 +1408,8 @@ class DedupePage(QFrame):
         )
         # Apply: rebuild model keeping only first of each duplicate group not yet resolved
         self.state.snapshot_model()
-        from policy_merger.models import PolicySet as _PS
         current_cols = self.state.model._columns  # type: ignore[attr-defined]
-        ps = _PS(source_fortigate="MERGED", columns=current_cols)
+        ps = PolicySet(source_fortigate="MERGED", columns=current_cols)
         # Build a set of keys to drop duplicates for
         keys = [k for k, v in self.state.duplicate_groups.items() if len(v) > 1 and k not in self.state.resolved_duplicate_keys]
         drop_ids = set()
@@ -1271,10 +1417,7 @@ class DedupePage(QFrame):
             items = self.state.duplicate_groups[key]
             for dup in items[1:]:
                 drop_ids.add(id(dup.raw))
-        for r in self.state.model._rules:  # type: ignore[attr-defined]
-            if id(r.raw) in drop_ids:
-                continue
-            ps.add_rule(r.raw)
+        ps.add_rules(r.raw for r in self.state.model._rules if id(r.raw) not in drop_ids)  # type: ignore[attr-defined]
         self.state.model.set_policy_sets([ps])
         for k in keys:
             self.state.resolved_duplicate_keys.add(k)
@@ -1283,20 +1426,17 @@ class DedupePage(QFrame):
 
     def _keep_both(self) -> None:
         row = self._groups_list.currentRow()
-        if row < 0:
+        if row < 0 or row >= len(self._group_keys):
             return
-        keys = [k for k, v in self.state.duplicate_groups.items() if len(v) > 1]
-        key = keys[row]
+        key = self._group_keys[row]
         items = self.state.duplicate_groups.get(key, [])
         if len(items) <= 1:
             return
         # Append duplicates (index >=1) into the model with rename
         self.state.snapshot_model()
-        from policy_merger.models import PolicySet as _PS
         current_cols = self.state.model._columns  # type: ignore[attr-defined]
-        ps = _PS(source_fortigate="MERGED", columns=current_cols)
-        for r in self.state.model._rules:  # type: ignore[attr-defined]
-            ps.add_rule(r.raw)
+        ps = PolicySet(source_fortigate="MERGED", columns=current_cols)
+        ps.add_rules(r.raw for r in self.state.model._rules)  # type: ignore[attr-defined]
         for dup in items[1:]:
             row_raw = dict(dup.raw)
             nm = row_raw.get('name', '').strip()
@@ -1332,16 +1472,14 @@ class DedupePage(QFrame):
             return
         if item_row == 0:
             return
-        keys = [k for k, v in self.state.duplicate_groups.items() if len(v) > 1]
-        key = keys[row]
+        key = self._group_keys[row]
         items = self.state.duplicate_groups.get(key, [])
         chosen = items[item_row]
         kept = items[0]
         # Replace kept in model
         self.state.snapshot_model()
-        from policy_merger.models import PolicySet as _PS
         current_cols = self.state.model._columns  # type: ignore[attr-defined]
-        ps = _PS(source_fortigate="MERGED", columns=current_cols)
+        ps = PolicySet(source_fortigate="MERGED", columns=current_cols)
         for r in self.state.model._rules:  # type: ignore[attr-defined]
             if r.raw == kept.raw:
                 ps.add_rule(chosen.raw)
@@ -1430,16 +1568,13 @@ class AuditPage(QFrame):
         self._refresh()
 
     def _refresh(self) -> None:
-        self._list.clear()
         # Populate filter options
         actions = sorted({d.get("action", "") for d in self.state.audit_log if d})
         current = self._action_filter.currentText() if self._action_filter.count() > 0 else "All"
         self._action_filter.blockSignals(True)
         self._action_filter.clear()
         self._action_filter.addItem("All")
-        for a in actions:
-            if a:
-                self._action_filter.addItem(a)
+        self._action_filter.addItems([a for a in actions if a])
         # restore selection if possible
         idx = self._action_filter.findText(current)
         if idx >= 0:
@@ -1448,13 +1583,15 @@ class AuditPage(QFrame):
 
         query = (self._search.text() or "").lower()
         action_sel = self._action_filter.currentText()
+        texts: List[str] = []
         for entry in self.state.audit_log:
             text = str(entry)
             if action_sel != "All" and entry.get("action") != action_sel:
                 continue
             if query and query not in text.lower():
                 continue
-            self._list.addItem(text)
+            texts.append(text)
+        _fill_list(self._list, texts)
 
     def _export_json(self) -> None:
         import json
@@ -1579,6 +1716,11 @@ class FluentMainWindow(FluentWindow):
         self._initNavigation()
         self._initWindow()
 
+    def closeEvent(self, e) -> None:  # type: ignore[override]
+        # The import thread (and its worker processes) must finish before the window goes away
+        self.importPage.wait_for_load()
+        super().closeEvent(e)
+
     def _goto_review(self) -> None:
         # First go to Dedupe review step
         try:
@@ -1614,8 +1756,8 @@ class FluentMainWindow(FluentWindow):
 
 
 def run() -> None:
-    configure_logging()
     app = QApplication(sys.argv)
+    configure_logging()
     setTheme(Theme.AUTO)
     w = FluentMainWindow()
     w.show()
@@ -1624,6 +1766,8 @@ def run() -> None:
 
 
 if __name__ == "__main__":
+    # Packaged builds start CSV worker processes from this entry point
+    multiprocessing.freeze_support()
     run()
 
 
@@ -18,7 +18,8 @@ from PyQt6.QtCore import QStandardPaths
 
 from policy_merger.csv_loader import read_policy_csv
 from policy_merger.diff_engine import find_similar_rules
-from policy_merger.merger import write_merged_csv, merge_fields
+from policy_merger.merger import write_merged_csv, merge_fields, DEFAULT_MERGE_FIELDS
+from policy_merger.models import PolicySet
 from policy_merger.gui.models import PolicyTableModel
 from policy_merger.gui.merge_dialog import MergeDialog
 from policy_merger.gui.diff_dialog import DiffDialog
@@ -138,10 +139,8 @@ class MainWindow(QMainWindow):
                 data = json.load(f)
             cols = data.get("columns", [])
             rules = data.get("rules", [])
-            from policy_merger.models import PolicySet
             ps = PolicySet(source_fortigate="SESSION", columns=cols)
-            for row in rules:
-                ps.add_rule(row)
+            ps.add_rules(rules)
             self._model.set_policy_sets([ps])
             QMessageBox.information(self, "Loaded", f"Loaded session from {path}")
         except Exception as e:
@@ -192,24 +191,22 @@ class MainWindow(QMainWindow):
                 removed_ids.add(id(s.rule_a))
             elif choice == "keep_both":
                 # rename second
-                name_b = s.rule_b.raw.get("name", "").strip()
+                name_b = s.rule_b.clean("name")
                 s.rule_b.raw["name"] = f"{name_b}-from-{s.rule_b.source_fortigate}" if name_b else f"rule-from-{s.rule_b.source_fortigate}"
+                s.rule_b.invalidate_cache()
             elif choice == "merge_into_a":
-                merged = merge_fields(s.rule_a, s.rule_b, fields=("srcaddr", "dstaddr", "service"))
+                merged = merge_fields(s.rule_a, s.rule_b, fields=DEFAULT_MERGE_FIELDS)
                 s.rule_a.raw.update(merged)
+                s.rule_a.invalidate_cache()
                 removed_ids.add(id(s.rule_b))
             elif choice == "merge_into_b":
-                merged = merge_fields(s.rule_b, s.rule_a, fields=("srcaddr", "dstaddr", "service"))
+                merged = merge_fields(s.rule_b, s.rule_a, fields=DEFAULT_MERGE_FIELDS)
                 s.rule_b.raw.update(merged)
+                s.rule_b.invalidate_cache()
                 removed_ids.add(id(s.rule_a))
         if removed_ids:
-            # Rebuild model rules excluding removed
-            remaining = [r for r in self._model._rules if id(r) not in removed_ids]
-            from policy_merger.models import PolicySet
-            ps = PolicySet(source_fortigate="MERGED", columns=self._model._columns)
-            for r in remaining:
-                ps.add_rule(r.raw)
-            self._model.set_policy_sets([ps])
+            # Drop removed rows in place
+            self._model.remove_rules_by_id(removed_ids)
 
 
 def run() -> None:
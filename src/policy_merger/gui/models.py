@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from typing import List
+from typing import AbstractSet, List, Sequence
 
 from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt, QVariant
 
-from ..models import PolicyRule, PolicySet
+from ..models import IDENTITY_FIELDS, PolicyRule, PolicySet
+
+
+# Columns shown in the compact review view, in display order
+COMPACT_COLUMNS = ("name",) + IDENTITY_FIELDS
 
 
 class PolicyTableModel(QAbstractTableModel):
@@ -13,7 +17,10 @@ class PolicyTableModel(QAbstractTableModel):
         self._rules: List[PolicyRule] = []
         self._columns: List[str] = []
         self._display_columns: List[str] | None = None
+        self._compact_columns: List[str] = []
         self._editable: bool = False
+        # Bumped whenever the rules or their values change; lets views cache derived results
+        self._generation: int = 0
         if policy_sets:
             self.set_policy_sets(policy_sets)
 
@@ -27,8 +34,30 @@ class PolicyTableModel(QAbstractTableModel):
             self._columns = list(self._rules[0].raw.keys())
         else:
             self._columns = []
+        self._update_compact_columns()
+        self._generation += 1
         self.endResetModel()
 
+    def remove_rules_by_id(self, rule_ids: AbstractSet[int]) -> int:
+        """Remove the rules whose id() is in `rule_ids`, one rowsRemoved per contiguous run."""
+        removed = 0
+        row = len(self._rules) - 1
+        # Walk backwards so earlier row numbers stay valid while runs are removed
+        while row >= 0:
+            if id(self._rules[row]) not in rule_ids:
+                row -= 1
+                continue
+            last = row
+            while row >= 0 and id(self._rules[row]) in rule_ids:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row + 1, last)
+            del self._rules[row + 1:last + 1]
+            self.endRemoveRows()
+            removed += last - row
+        if removed:
+            self._generation += 1
+        return removed
+
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
         if parent.isValid():
             return 0
@@ -80,6 +109,8 @@ class PolicyTableModel(QAbstractTableModel):
             return False
         col = cols[col_idx]
         self._rules[row].raw[col] = str(value)
+        self._rules[row].invalidate_cache()
+        self._generation += 1
         self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
         return True
 
@@ -88,6 +119,17 @@ class PolicyTableModel(QAbstractTableModel):
         self._display_columns = list(columns) if columns is not None else None
         self.endResetModel()
 
+    def generation(self) -> int:
+        return self._generation
+
+    def _update_compact_columns(self) -> None:
+        available = frozenset(self._columns)
+        self._compact_columns = [c for c in COMPACT_COLUMNS if c in available]
+
+    def compact_columns(self) -> List[str]:
+        """Identity columns (plus name) present in the loaded data, in display order."""
+        return list(self._compact_columns)
+
     def all_columns(self) -> List[str]:
         return list(self._columns)
 
@@ -98,3 +140,57 @@ class PolicyTableModel(QAbstractTableModel):
             self.layoutChanged.emit()
 
 
+class RuleDetailsModel(QAbstractTableModel):
+    """Read-only Field/Value rows for one rule; values are fetched only for painted cells."""
+
+    _HEADERS = ("Field", "Value")
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._rule: PolicyRule | None = None
+        self._columns: List[str] = []
+
+    def set_rule(self, rule: PolicyRule | None, columns: Sequence[str]) -> None:
+        columns = list(columns) if rule is not None else []
+        if columns != self._columns:
+            self.beginResetModel()
+            self._rule = rule
+            self._columns = columns
+            self.endResetModel()
+            return
+        self._rule = rule
+        if self._columns:
+            self.dataChanged.emit(self.index(0, 1), self.index(len(self._columns) - 1, 1), [Qt.ItemDataRole.DisplayRole])
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        if parent.isValid():
+            return 0
+        return len(self._columns)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        if parent.isValid():
+            return 0
+        return 2
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> QVariant:  # type: ignore[override]
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole or self._rule is None:
+            return QVariant()
+        col = self._columns[index.row()]
+        if index.column() == 0:
+            return col
+        return self._rule.clean(col)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):  # type: ignore[override]
+        if role != Qt.ItemDataRole.DisplayRole:
+            return QVariant()
+        if orientation == Qt.Orientation.Horizontal:
+            if 0 <= section < len(self._HEADERS):
+                return self._HEADERS[section]
+        else:
+            return section + 1
+        return QVariant()
+
+    def flags(self, index: QModelIndex):  # type: ignore[override]
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled
@@ -1,12 +1,10 @@
 from __future__ import annotations
 
-import argparse
-import os
 from typing import Dict, Iterable, List, Sequence, Tuple
 
-from .csv_loader import read_policy_csv
-from .diff_engine import compare_rules, find_similar_rules, group_by_identity
-from .merger import merge_fields, write_merged_csv
+from .csv_loader import filter_existing_paths, read_policy_csv
+from .diff_engine import compare_rules, compute_all_groupings, find_similar_rules, similarity_excluded_fields
+from .merger import DEFAULT_MERGE_FIELDS, merge_fields, write_merged_csv
 from .models import PolicyRule
 
 
@@ -54,8 +52,15 @@ def interactive_merge(file_paths: List[str], output_path: str, min_similarity: f
 
     print(f"Loaded {len(file_paths)} files, total rules: {len(all_rules)}")
 
+    # Identity and stable-key groupings in one pass over the rules
+    candidate_fields = ("srcaddr", "dstaddr", "service")
+    identity_groups, stable_groups, _ = compute_all_groupings(
+        all_rules,
+        excluded_for_stable=similarity_excluded_fields(candidate_fields),
+        include_context=False,
+    )
+
     # Prepare identical pairs
-    identity_groups = group_by_identity(all_rules)
     identical_pairs: List[Tuple[PolicyRule, PolicyRule]] = []
     for rules in identity_groups.values():
         if len(rules) > 1:
@@ -65,7 +70,9 @@ def interactive_merge(file_paths: List[str], output_path: str, min_similarity: f
                     identical_pairs.append((rules[i], rules[j]))
 
     # Prepare similarity suggestions
-    suggestions = find_similar_rules(all_rules, min_similarity=min_similarity)
+    suggestions = find_similar_rules(
+        all_rules, candidate_fields=candidate_fields, min_similarity=min_similarity, stable_groups=stable_groups
+    )
 
     queue: List[Tuple[str, Tuple[PolicyRule, PolicyRule]]] = []
     for a, b in identical_pairs:
@@ -112,16 +119,20 @@ def interactive_merge(file_paths: List[str], output_path: str, min_similarity: f
         elif choice == "3":
             name_b = b.raw.get("name", "").strip()
             b.raw["name"] = f"{name_b}-from-{b.source_fortigate}" if name_b else f"rule-from-{b.source_fortigate}"
+            b.invalidate_cache()
         elif choice == "4":
             name_a = a.raw.get("name", "").strip()
             a.raw["name"] = f"{name_a}-from-{a.source_fortigate}" if name_a else f"rule-from-{a.source_fortigate}"
+            a.invalidate_cache()
         elif choice == "5" and kind == "similar":
-            merged = merge_fields(a, b, fields=("srcaddr", "dstaddr", "service"))
+            merged = merge_fields(a, b, fields=DEFAULT_MERGE_FIELDS)
             a.raw.update(merged)
+            a.invalidate_cache()
             del active[id(b)]
         elif choice == "6" and kind == "similar":
-            merged = merge_fields(b, a, fields=("srcaddr", "dstaddr", "service"))
+            merged = merge_fields(b, a, fields=DEFAULT_MERGE_FIELDS)
             b.raw.update(merged)
+            b.invalidate_cache()
             del active[id(a)]
         elif choice == "s":
             idx += 1
@@ -141,13 +152,15 @@ def interactive_merge(file_paths: List[str], output_path: str, min_similarity: f
 
 
 def main() -> None:
+    import argparse  # deferred: only needed when run as a script
+
     parser = argparse.ArgumentParser(description="Interactive Policy Merger")
     parser.add_argument("files", nargs="+", help="CSV files to load")
     parser.add_argument("--out", required=True, help="Path to write merged CSV")
     parser.add_argument("--min-similarity", type=float, default=0.2)
     args = parser.parse_args()
 
-    csv_files = [f for f in args.files if os.path.exists(f)]
+    csv_files = filter_existing_paths(args.files)
     if not csv_files:
         raise SystemExit("No valid CSV files provided")
 
@@ -6,6 +6,10 @@ from .models import PolicyRule, PolicySet
 from .csv_loader import write_policy_csv
 
 
+# Fields unioned by a merge when the caller does not choose them
+DEFAULT_MERGE_FIELDS: Tuple[str, ...] = ("srcaddr", "dstaddr", "service")
+
+
 def _normalize_space(value: str) -> str:
     return " ".join((value or "").strip().split())
 
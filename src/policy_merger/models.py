@@ -1,31 +1,52 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+IDENTITY_FIELDS: Tuple[str, ...] = (
+    "srcintf",
+    "dstintf",
+    "srcaddr",
+    "dstaddr",
+    "service",
+    "schedule",
+    "action",
+    "nat",
+)
 
 
 @dataclass
 class PolicyRule:
     raw: Dict[str, str]
     source_fortigate: str
+    _identity_sig: Optional[Tuple[str, ...]] = field(default=None, init=False, repr=False, compare=False)
+    _clean: Dict[str, str] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     def identity_signature(self) -> tuple:
-        def norm(value: Optional[str]) -> str:
-            if value is None:
-                return ""
-            return " ".join(value.strip().split()).lower()
-
-        key_fields = [
-            "srcintf",
-            "dstintf",
-            "srcaddr",
-            "dstaddr",
-            "service",
-            "schedule",
-            "action",
-            "nat",
-        ]
-        return tuple(norm(self.raw.get(k)) for k in key_fields)
+        """Normalized identity tuple, computed once and cached.
+
+        Call `invalidate_cache()` after mutating `raw` in place.
+        """
+        if self._identity_sig is None:
+            def norm(value: Optional[str]) -> str:
+                if value is None:
+                    return ""
+                return " ".join(value.strip().split()).lower()
+
+            self._identity_sig = tuple(norm(self.raw.get(k)) for k in IDENTITY_FIELDS)
+        return self._identity_sig
+
+    def clean(self, col: str) -> str:
+        """Stripped value of `col` ("" when missing), cached per column."""
+        value = self._clean.get(col)
+        if value is None:
+            value = self._clean[col] = (self.raw.get(col, "") or "").strip()
+        return value
+
+    def invalidate_cache(self) -> None:
+        self._identity_sig = None
+        self._clean.clear()
 
 
 @dataclass
@@ -37,6 +58,10 @@ class PolicySet:
     def add_rule(self, raw_row: Dict[str, str]) -> None:
         self.rules.append(PolicyRule(raw=raw_row, source_fortigate=self.source_fortigate))
 
+    def add_rules(self, raw_rows: Iterable[Dict[str, str]]) -> None:
+        source = self.source_fortigate
+        self.rules.extend(PolicyRule(raw=row, source_fortigate=source) for row in raw_rows)
+
     def to_rows(self) -> List[Dict[str, str]]:
         return [r.raw for r in self.rules]
 
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from policy_merger.batch_merge import batch_merge
+from policy_merger.csv_loader import read_policy_csv
+
+
+HEADER = "policyid,name,srcintf,dstintf,srcaddr,dstaddr,service,schedule,action,nat\n"
+
+
+def test_batch_merge_drops_identical_rules_across_files(tmp_path):
+    a = tmp_path / "FGT-A-20250101-000000.csv"
+    b = tmp_path / "FGT-B-20250101-000000.csv"
+    a.write_text(
+        "Firewall Policy\n" + HEADER
+        + "1,Web,port1,port2,LAN,DMZ,HTTP,always,accept,disable\n"
+        + "2,Dns,port1,port2,LAN,DNS,DNS,always,accept,disable\n",
+        encoding="utf-8",
+    )
+    b.write_text(
+        "Firewall Policy\n" + HEADER
+        + "7,Web copy,port1,port2,LAN,DMZ,HTTP,always,accept,disable\n",
+        encoding="utf-8",
+    )
+    out = tmp_path / "merged.csv"
+    total, kept = batch_merge([str(a), str(b)], str(out))
+    assert (total, kept) == (3, 2)
+    merged = read_policy_csv(str(out))
+    assert [r.raw["name"] for r in merged.rules] == ["Web", "Dns"]
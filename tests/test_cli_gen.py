@@ -99,3 +99,72 @@ def test_generate_with_objects_ordering():
     # Policies-only scope: only policy block is emitted
     assert "config firewall policy" in cli
 
+
+def test_catalog_mapping_trie_matches_set_lookup():
+    from policy_merger.cli_gen import _map_tokens_with_catalog, build_token_trie
+
+    names = {"Domain Controllers", "Domain", "Web Servers DMZ", "Web", "LAN"}
+    trie = build_token_trie(names)
+    for value in ("Domain Controllers LAN", "Web Servers LAN", "Web Servers DMZ Domain", "Other  Domain"):
+        assert _map_tokens_with_catalog(value, trie) == _map_tokens_with_catalog(value, names)
+    assert _map_tokens_with_catalog("Domain Controllers LAN", trie) == ["Domain Controllers", "LAN"]
+
+
+def test_generate_policies_keeps_multi_word_catalog_names():
+    catalog = ObjectCatalog(
+        addresses={"Domain Controllers": Address(name="Domain Controllers", subnet=("10.0.0.0", "255.255.255.0"))},
+    )
+    rules = [
+        make_rule(
+            name="DC",
+            srcintf="port1",
+            dstintf="port2",
+            srcaddr="LAN",
+            dstaddr="Domain Controllers",
+            service="DNS",
+        )
+    ]
+    cli = generate_fgt_cli(rules, catalog=catalog, include_objects=False)
+    assert 'set dstaddr "Domain Controllers"' in cli
+
+
+def test_catalog_sorted_names_refreshes_when_section_grows():
+    catalog = ObjectCatalog(addresses={"b": Address(name="b", subnet=("1.1.1.1", "255.255.255.255"))})
+    assert catalog.sorted_names("addresses") == ["b"]
+    catalog.addresses["a"] = Address(name="a", subnet=("1.1.1.2", "255.255.255.255"))
+    assert catalog.sorted_names("addresses") == ["a", "b"]
+
+
+def test_catalog_sorted_names_refreshes_after_invalidate():
+    catalog = ObjectCatalog(addresses={"a": Address(name="a", subnet=("1.1.1.1", "255.255.255.255"))})
+    rules = [make_rule(name="r", srcaddr="all", dstaddr="all", service="ALL", action="accept")]
+    assert "edit \"a\"" in generate_fgt_cli(rules, catalog=catalog, include_objects=True)
+    del catalog.addresses["a"]
+    catalog.addresses["b"] = Address(name="b", subnet=("1.1.1.2", "255.255.255.255"))
+    catalog.invalidate_sorted()
+    assert catalog.sorted_names("addresses") == ["b"]
+    cli = generate_fgt_cli(rules, catalog=catalog, include_objects=True)
+    assert "edit \"b\"" in cli and "edit \"a\"" not in cli
+
+
+def test_stream_fgt_cli_matches_generated_text():
+    import io
+    from policy_merger.cli_gen import stream_fgt_cli
+
+    rules = [
+        make_rule(name="dup", srcintf="port1", dstintf="port2", srcaddr="all", dstaddr="all", service="ALL"),
+        make_rule(name="dup", srcintf="port1", dstintf="port3", srcaddr="all", dstaddr="all", service="ALL"),
+    ]
+    buf = io.StringIO()
+    renames = stream_fgt_cli(rules, buf)
+    assert buf.getvalue() == generate_fgt_cli(rules)
+    assert len(renames) == 1
+
+
+def test_build_unique_policy_names_suffixes_repeated_bases():
+    from policy_merger.cli_gen import build_unique_policy_names
+
+    rules = [make_rule(name="web") for _ in range(4)] + [make_rule(name="web-2"), make_rule(name="web")]
+    overrides, renames = build_unique_policy_names(rules)
+    assert overrides == ["web", "web-1", "web-2", "web-3", "web-2-1", "web-4"]
+    assert len(renames) == 5
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from policy_merger.csv_loader import find_header_row, read_policy_csv
+from policy_merger.csv_loader import find_header_row, read_policy_csv, read_policy_csvs
 
 
 def test_find_header_row(tmp_path):
@@ -25,3 +25,54 @@ def test_read_policy_csv_parses_columns(tmp_path):
     assert ps.source_fortigate.startswith("RG-FOO-DEV")
 
 
+def test_read_policy_csv_handles_utf16_bom(tmp_path):
+    p = tmp_path / "FGT-A-20250101-000000.csv"
+    content = (
+        "Firewall Policy\n"
+        "policyid,name,srcintf,dstintf,srcaddr,dstaddr,service,schedule,action,nat\n"
+        "1,Règle A,port1,port2,SRC,DST,ALL,always,accept,disable\n"
+    )
+    p.write_bytes(content.encode("utf-16"))
+    ps = read_policy_csv(str(p))
+    assert ps.columns[0] == "policyid"
+    assert [r.raw["name"] for r in ps.rules] == ["Règle A"]
+
+
+def test_read_policy_csvs_preserves_input_order(tmp_path):
+    header = "policyid,name,srcintf,dstintf,srcaddr,dstaddr,service,schedule,action,nat\n"
+    paths = []
+    for dev in ("FGT-A", "FGT-B", "FGT-C"):
+        p = tmp_path / f"{dev}-20250101-000000.csv"
+        p.write_text("Firewall Policy\n" + header + f"1,{dev} rule,port1,port2,SRC,DST,ALL,always,accept,disable\n", encoding="utf-8")
+        paths.append(str(p))
+    sets = list(read_policy_csvs(paths, max_workers=2))
+    assert [ps.source_fortigate for ps in sets] == ["FGT-A", "FGT-B", "FGT-C"]
+
+
+def test_filter_existing_paths_keeps_order_and_drops_missing(tmp_path):
+    from policy_merger.csv_loader import filter_existing_paths
+
+    a = tmp_path / "a.csv"
+    b = tmp_path / "b.csv"
+    a.write_text("x")
+    b.write_text("x")
+    paths = [str(b), str(tmp_path / "missing.csv"), str(a), str(tmp_path / "nodir" / "c.csv")]
+    assert filter_existing_paths(paths) == [str(b), str(a)]
+
+
+def test_derive_source_fortigate_tag():
+    from policy_merger.csv_loader import derive_source_fortigate_tag
+
+    assert derive_source_fortigate_tag("/x/FGT-HQ-01-20240131-235959.csv") == "FGT-HQ-01"
+    assert derive_source_fortigate_tag("FGT-HQ-2024013-235959.csv") == "FGT-HQ-2024013-235959"
+    assert derive_source_fortigate_tag("-20240131-235959.csv") == "-20240131-235959"
+
+
+def test_read_policy_csv_pads_short_rows_and_skips_blank_lines(tmp_path):
+    p = tmp_path / "FGT1-20240101-000000.csv"
+    p.write_text('preamble\npolicyid,name,srcaddr\n1,"a, b"\n\n2,c,"x y"\n', encoding="utf-8")
+    ps = read_policy_csv(str(p))
+    assert [r.raw for r in ps.rules] == [
+        {"policyid": "1", "name": "a, b", "srcaddr": ""},
+        {"policyid": "2", "name": "c", "srcaddr": "x y"},
+    ]
@@ -61,3 +61,75 @@ def test_single_field_grouping_finds_groups_and_unions():
     assert groups, "Expected at least one single-field merge group"
     varying = {g.varying_field for g in groups}
     assert "srcaddr" in varying
+
+
+def test_find_similar_rules_treats_whitespace_variants_as_identical():
+    from policy_merger.diff_engine import find_similar_rules
+
+    a = make_rule("A", "SRC1 SRC2", "DST1", "HTTP")
+    b = make_rule("B", "SRC1  SRC2 ", "DST1", "HTTP")
+    c = make_rule("C", "SRC1", "DST1", "HTTP")
+
+    suggestions = find_similar_rules([a, b, c])
+    assert [(s.rule_a.raw["name"], s.rule_b.raw["name"]) for s in suggestions] == [("A", "B"), ("A", "C"), ("B", "C")]
+    assert suggestions[0].field_diffs == {} and suggestions[0].similarity_score == 1.0
+    assert suggestions[2].field_diffs == {"srcaddr": ("SRC1  SRC2 ", "SRC1")}
+    assert suggestions[1].similarity_score == suggestions[2].similarity_score == 0.5
+
+
+def test_five_field_suggestions_skip_pairs_without_shared_tokens():
+    from policy_merger.diff_engine import find_merge_suggestions_five_fields
+
+    a = make_rule("A", "SRC1", "DST1", "HTTP")
+    b = make_rule("B", "SRC9", "DST9", "SSH")  # shares only interfaces, which are equal
+    c = make_rule("C", "SRC1 SRC2", "DST1", "HTTP")
+    d = make_rule("D", "SRC1", "DST1", "HTTP")
+
+    pairs = [(s.rule_a.raw["name"], s.rule_b.raw["name"]) for s in find_merge_suggestions_five_fields([a, b, c, d])]
+    assert pairs == [("A", "C"), ("A", "D"), ("C", "D")]
+
+
+def test_compute_all_groupings_matches_individual_groupers():
+    from policy_merger.diff_engine import (
+        compute_all_groupings,
+        group_by_identity,
+        group_by_minimal_context,
+        group_by_stable_key,
+    )
+
+    rules = [
+        make_rule("A", "SRC1", "DST1", "HTTP"),
+        make_rule("B", "SRC1", "DST1", "HTTP"),
+        make_rule("C", "SRC2", "DST1", "SSH"),
+    ]
+    excluded = ("srcaddr", "dstaddr", "service", "name", "policyid")
+    identity, stable, context = compute_all_groupings(rules, excluded_for_stable=excluded)
+    assert identity == group_by_identity(rules)
+    assert stable == group_by_stable_key(rules, excluded_fields=excluded)
+    assert context == group_by_minimal_context(rules)
+
+    identity, stable, context = compute_all_groupings(rules, excluded_for_stable=excluded, include_context=False)
+    assert identity == group_by_identity(rules)
+    assert stable == group_by_stable_key(rules, excluded_fields=excluded)
+    assert context == {}
+
+
+def test_suggestion_diff_fields_are_sorted():
+    a = make_rule("A", "SRC1", "DST1", "HTTP")
+    b = make_rule("B", "SRC2", "DST1", "HTTPS")
+
+    suggestions = [s for group in group_similarity_suggestions([a, b]).values() for s in group]
+    assert [s.diff_fields for s in suggestions] == [("service", "srcaddr")]
+
+
+def test_five_field_key_normalizes_whitespace_and_missing_values():
+    from policy_merger.diff_engine import five_field_key, group_duplicates_by_five_fields
+
+    a = make_rule("A", " SRC1   SRC2 ", "DST1", "HTTP")
+    b = make_rule("B", "SRC1 SRC2", "DST1", "HTTP")
+    b.raw["dstintf"] = None  # type: ignore[assignment]
+    del a.raw["dstintf"]
+
+    assert five_field_key(a) == ("SRC1 SRC2", "DST1", "port1", "", "HTTP")
+    groups = group_duplicates_by_five_fields([a, b])
+    assert [[r.raw["name"] for r in g] for g in groups.values()] == [["A", "B"]]
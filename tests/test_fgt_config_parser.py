@@ -1,4 +1,4 @@
-from policy_merger.fgt_config_parser import parse_fgt_config_text
+from policy_merger.fgt_config_parser import _extract_blocks, parse_fgt_config_text
 
 
 def test_parse_minimal_objects():
@@ -46,3 +46,24 @@ def test_parse_minimal_objects():
     assert "Pool1" in cat.ippools and cat.ippools["Pool1"].pool_type == "overload"
 
 
+def test_extract_blocks_skips_other_sections_and_mixed_line_endings():
+    cfg = (
+        "config system interface\n"
+        "    edit \"port1\"\n"
+        "        set description \"config firewall address\"\n"
+        "    next\n"
+        "end\n"
+        "config firewall address\r\n"
+        "    edit \"HQ\"\r\n"
+        "        set comment \"friend\"\r\n"
+        "    next\r\n"
+        "  end  \r\n"
+        "config firewall ippool\n"
+        "    edit \"Pool1\"\n"
+        "        set endip 5.5.5.10\n"
+        "    next\n"
+        "end"
+    )
+    blocks = _extract_blocks(cfg.splitlines())
+    assert len(blocks["config firewall address"]) == 1
+    assert blocks["config firewall ippool"][0][1] == "set endip 5.5.5.10"
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from policy_merger.models import PolicyRule, PolicySet
+
+
+def test_identity_signature_is_cached_until_invalidated():
+    rule = PolicyRule(raw={"srcaddr": " SRC1 ", "dstaddr": "DST1"}, source_fortigate="FG1")
+    sig = rule.identity_signature()
+    assert rule.identity_signature() is sig
+    assert sig[2] == "src1"
+
+    rule.raw["srcaddr"] = "SRC2"
+    assert rule.identity_signature() is sig
+    rule.invalidate_cache()
+    assert rule.identity_signature()[2] == "src2"
+
+
+def test_add_rules_wraps_rows_with_set_source():
+    ps = PolicySet(source_fortigate="MERGED")
+    rows = [{"name": "a"}, {"name": "b"}]
+    ps.add_rules(iter(rows))
+    assert [r.raw for r in ps.rules] == rows
+    assert ps.rules[0].raw is rows[0]
+    assert {r.source_fortigate for r in ps.rules} == {"MERGED"}
+
+
+def test_clean_strips_and_caches_until_invalidated():
+    rule = PolicyRule(raw={"name": " web ", "comments": None}, source_fortigate="FG1")  # type: ignore[dict-item]
+    assert rule.clean("name") == "web"
+    assert rule.clean("comments") == ""
+    assert rule.clean("missing") == ""
+
+    rule.raw["name"] = "web-from-FG1"
+    assert rule.clean("name") == "web"
+    rule.invalidate_cache()
+    assert rule.clean("name") == "web-from-FG1"